@@ -1,6 +1,15 @@
-"""aiotedee – async Python client for Tedee smart locks."""
+"""aiotedee – async Python client for Tedee smart locks.
+
+Everything except the exceptions is imported lazily on first attribute
+access, so importing the package (or a light submodule such as
+``aiotedee.webhook``) does not pull in aiohttp.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .client import TedeeCloudClient, TedeeLocalClient
 from .exceptions import (
     TedeeAuthException,
     TedeeClientException,
@@ -9,14 +18,53 @@ from .exceptions import (
     TedeeRateLimitException,
     TedeeWebhookException,
 )
-from .models import TedeeBridge, TedeeDeviceType, TedeeDoorState, TedeeLock, TedeeLockState
+
+if TYPE_CHECKING:
+    from .client import TedeeCloudClient, TedeeLocalClient
+    from .fleet import TedeeFleet
+    from .models import (
+        TedeeBridge,
+        TedeeDeviceType,
+        TedeeDoorState,
+        TedeeLock,
+        TedeeLockChange,
+        TedeeLockState,
+    )
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .server import TedeeWebhookServer
+    from .simulator import TedeeBridgeSimulator
+    from .table import LockStateTable
+
+_LAZY_IMPORTS = {
+    "LockStateTable": ".table",
+    "RateLimiter": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "TedeeBridge": ".models",
+    "TedeeBridgeSimulator": ".simulator",
+    "TedeeCloudClient": ".client",
+    "TedeeDeviceType": ".models",
+    "TedeeDoorState": ".models",
+    "TedeeFleet": ".fleet",
+    "TedeeLocalClient": ".client",
+    "TedeeLock": ".models",
+    "TedeeLockChange": ".models",
+    "TedeeLockState": ".models",
+    "TedeeWebhookServer": ".server",
+}
 
 __all__ = [
+    "LockStateTable",
+    "RateLimiter",
+    "RetryPolicy",
     "TedeeBridge",
+    "TedeeBridgeSimulator",
     "TedeeCloudClient",
     "TedeeDoorState",
+    "TedeeFleet",
     "TedeeLocalClient",
     "TedeeLock",
+    "TedeeLockChange",
     "TedeeLockState",
     "TedeeDeviceType",
     "TedeeAuthException",
@@ -25,4 +73,18 @@ __all__ = [
     "TedeeLocalAuthException",
     "TedeeRateLimitException",
     "TedeeWebhookException",
+    "TedeeWebhookServer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
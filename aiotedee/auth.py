@@ -0,0 +1,61 @@
+"""Authentication token generation for the local bridge API."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from email.utils import parsedate_to_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+# HTTP dates have a resolution of one second; offsets within that are noise.
+_DATE_RESOLUTION_MS = 1000
+
+
+class LocalTokenProvider:
+    """Generate hashed ``api_token`` values for the local bridge API.
+
+    The bridge expects ``sha256(token + timestamp) + timestamp`` with the
+    timestamp in milliseconds of *its* clock.  The token is fed into a
+    SHA-256 state once and copied per request, and the offset between the
+    local and the bridge clock is estimated from the ``Date`` header of the
+    bridge responses so drifting hosts keep producing accepted tokens.
+    """
+
+    def __init__(self, token: str) -> None:
+        self._hash = hashlib.sha256(token.encode())
+        self._offset_ms = 0
+
+    @property
+    def clock_offset(self) -> float:
+        """Return the estimated bridge clock offset in seconds."""
+        return self._offset_ms / 1000
+
+    def token(self) -> str:
+        """Return a token for the current (bridge) time."""
+        ms = str(time.time_ns() // 1_000_000 + self._offset_ms)
+        digest = self._hash.copy()
+        digest.update(ms.encode())
+        return digest.hexdigest() + ms
+
+    def observe_date(self, date: str | None) -> bool:
+        """Update the clock offset from a ``Date`` response header.
+
+        Returns whether the offset changed.
+        """
+        if not date:
+            return False
+        try:
+            bridge_ms = parsedate_to_datetime(date).timestamp() * 1000
+        except (TypeError, ValueError):
+            return False
+        # The header is truncated to whole seconds, assume the middle.
+        offset = round(
+            bridge_ms + _DATE_RESOLUTION_MS / 2 - time.time_ns() // 1_000_000
+        )
+        if abs(offset - self._offset_ms) < _DATE_RESOLUTION_MS:
+            return False
+        _LOGGER.debug("Bridge clock offset changed to %sms", offset)
+        self._offset_ms = offset
+        return True
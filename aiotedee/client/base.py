@@ -4,24 +4,88 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import tempfile
+import time
 from abc import abstractmethod
-from typing import Any, ValuesView
+from collections.abc import Callable, Coroutine, Hashable, Iterable, Iterator
+from typing import Any, Self, TypeVar, ValuesView
 
 from aiohttp import ClientSession
 
-from ..const import LOCK_DELAY, TIMEOUT, UNLOCK_DELAY
-from ..exceptions import TedeeClientException, TedeeWebhookException
-from ..models import TedeeLock, TedeeLockState
-from ..webhook import WEBHOOK_HANDLERS
+from ..codec import (
+    JsonDumps,
+    JsonLoads,
+    json_dumps as default_json_dumps,
+    json_loads as default_json_loads,
+)
+from ..const import (
+    LOCK_DELAY,
+    OPERATION_POLL_INTERVAL,
+    SNAPSHOT_VERSION,
+    TIMEOUT,
+    UNLOCK_DELAY,
+)
+from ..exceptions import TedeeClientException, TedeeException, TedeeWebhookException
+from ..index import LockIndex
+from ..models import (
+    FieldChanges,
+    TedeeDoorState,
+    TedeeLock,
+    TedeeLockChange,
+    TedeeLockState,
+)
+from ..ratelimit import DEFAULT_RATE_LIMITER, RateLimiter
+from ..table import LockStateTable
+from ..webhook import WEBHOOK_HANDLERS, WebhookHandler, webhook_lock_state
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+LockListener = Callable[[TedeeLock, TedeeLockChange], None]
+
+_PULL_STATES = frozenset(
+    {TedeeLockState.PULLING, TedeeLockState.PULLED, TedeeLockState.UNPULLING}
+)
+
+
+class _StateWaiter:
+    """Future resolved once a lock is observed in one of the target states.
+
+    If *via* is given, one of those states must be observed first, so that an
+    operation starting and ending in the same state (e.g. pulling an unlocked
+    lock) is not reported complete before it started.
+    """
+
+    def __init__(
+        self,
+        targets: frozenset[TedeeLockState],
+        via: frozenset[TedeeLockState] = frozenset(),
+    ) -> None:
+        self.targets = targets
+        self.via = via
+        self.future: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def observe(self, state: TedeeLockState) -> None:
+        """Record an observed lock state."""
+        if self.future.done():
+            return
+        if self.via:
+            if state in self.via:
+                self.via = frozenset()
+            return
+        if state in self.targets:
+            self.future.set_result(None)
+
 
 class TedeeClientBase:
     """Base class with shared state management and business logic.
 
-    Subclasses must implement the three transport methods:
-    :meth:`_fetch_locks`, :meth:`_fetch_sync`, and
+    Subclasses must implement the four transport methods:
+    :meth:`_fetch_locks`, :meth:`_fetch_sync`, :meth:`_fetch_lock`, and
     :meth:`_execute_lock_operation`.
     """
 
@@ -31,15 +95,46 @@ class TedeeClientBase:
         timeout: int = TIMEOUT,
         bridge_id: int | None = None,
         session: ClientSession | None = None,
+        operation_poll_interval: float | None = OPERATION_POLL_INTERVAL,
+        rate_limiter: RateLimiter | None = None,
+        json_loads: JsonLoads | None = None,
+        json_dumps: JsonDumps | None = None,
+        state_table: LockStateTable | None = None,
         **_kwargs: Any,
     ) -> None:
         self._timeout = timeout
         self._bridge_id = bridge_id
         self._locks: dict[int, TedeeLock] = {}
-        self._session = session or ClientSession()
+        self._session = session
+        self._owns_session = session is None
+        self._closed = False
+        self._operation_poll_interval = operation_poll_interval
+        self._state_waiters: dict[int, list[_StateWaiter]] = {}
+        self._rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._last_confirmed: dict[int, float] = {}
+        self._listeners: dict[int | None, list[LockListener]] = {}
+        self._json_loads = json_loads or default_json_loads
+        self._json_dumps = json_dumps or default_json_dumps
+        self._state_table = state_table
+        self._state_table_key: Hashable | None = None
+        self._index = LockIndex()
 
     # -- Public properties -----------------------------------------------------
 
+    @property
+    def session(self) -> ClientSession:
+        """Return the HTTP session, creating an owned one on first use.
+
+        Raises:
+            TedeeClientException: If the client was closed.
+        """
+        if self._closed:
+            raise TedeeClientException("Client is closed")
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
     @property
     def locks(self) -> ValuesView[TedeeLock]:
         """Return all locks."""
@@ -50,70 +145,270 @@ class TedeeClientBase:
         """Return locks keyed by ID."""
         return self._locks
 
+    @property
+    def state_table(self) -> LockStateTable | None:
+        """Return the columnar table mirroring the lock states, if any."""
+        return self._state_table
+
+    @state_table.setter
+    def state_table(self, table: LockStateTable | None) -> None:
+        """Attach a columnar table, filling it with the current locks."""
+        self.attach_state_table(table)
+
+    def attach_state_table(
+        self, table: LockStateTable | None, key: Hashable | None = None
+    ) -> None:
+        """Attach a columnar table, filling it with the current locks.
+
+        Pass a *key* unique to this client when the table is shared with
+        other clients, so locks with the same ID do not overwrite each other.
+        """
+        self._state_table = table
+        self._state_table_key = key
+        if table is not None:
+            for lock in self._locks.values():
+                table.upsert(lock, key)
+
+    async def close(self) -> None:
+        """Close the HTTP session if it was created by the client.
+
+        Sessions passed in by the caller are left open.  The client cannot
+        make requests afterwards.
+        """
+        self._closed = True
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    def locks_by_bridge(self, bridge_id: int) -> list[TedeeLock]:
+        """Return the locks connected to the bridge with *bridge_id*."""
+        return self._lookup("connected_to_id", bridge_id)
+
+    def locks_by_state(self, state: TedeeLockState) -> list[TedeeLock]:
+        """Return the locks currently in *state*."""
+        return self._lookup("state", state)
+
+    def locks_by_door_state(self, door_state: TedeeDoorState) -> list[TedeeLock]:
+        """Return the locks whose door is currently in *door_state*."""
+        return self._lookup("door_state", door_state)
+
+    def locks_by_connection(self, is_connected: bool = True) -> list[TedeeLock]:
+        """Return the connected locks, or the disconnected ones if False."""
+        return self._lookup("is_connected", is_connected)
+
+    def lock_age(self, lock_id: int) -> float | None:
+        """Return seconds since the state of a lock was last confirmed.
+
+        A state is confirmed by a sync or by a webhook for that lock.  Returns
+        None if the lock was never confirmed.
+        """
+        confirmed = self._last_confirmed.get(lock_id)
+        if confirmed is None:
+            return None
+        return time.monotonic() - confirmed
+
+    # -- Subscriptions ---------------------------------------------------------
+
+    def subscribe(
+        self, lock_id: int | None, callback: LockListener
+    ) -> Callable[[], None]:
+        """Call *callback* whenever a lock changes and return an unsubscriber.
+
+        With a *lock_id* the callback only fires for that lock, with None it
+        fires for every lock.  Callbacks are invoked by :meth:`sync`,
+        :meth:`sync_lock` and :meth:`parse_webhook_message`, and only if at
+        least one field actually changed.
+        """
+        listeners = self._listeners.setdefault(lock_id, [])
+        listeners.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in listeners:
+                listeners.remove(callback)
+            if not listeners and self._listeners.get(lock_id) is listeners:
+                del self._listeners[lock_id]
+
+        return unsubscribe
+
     # -- Lock retrieval & sync -------------------------------------------------
 
     async def get_locks(self) -> None:
-        """Fetch and store all registered locks."""
-        result = await self._fetch_locks()
+        """Fetch and store all registered locks.
+
+        Concurrent calls share a single request and its result.
+        """
+        await self._single_flight("get_locks", self._get_locks)
+
+    async def _get_locks(self) -> None:
+        result, is_local = await self._fetch_locks()
         if result is None:
             raise TedeeClientException("No data returned from get_locks")
 
-        for lock_json in self._filter_by_bridge(result):
-            lock = TedeeLock.from_api_response(lock_json)
+        now = time.monotonic()
+        for lock in TedeeLock.from_api_responses(
+            self._filter_by_bridge(result), local=is_local
+        ):
             self._locks[lock.id] = lock
+            self._last_confirmed[lock.id] = now
+            self._index.add(lock)
+            if self._state_table is not None:
+                self._state_table.upsert(lock, self._state_table_key)
 
         if not self._locks:
             raise TedeeClientException("No lock found")
 
         _LOGGER.debug("Locks retrieved successfully")
 
-    async def sync(self) -> None:
-        """Synchronize lock states with the API."""
+    async def sync(self, max_age: float | None = None) -> list[TedeeLockChange]:
+        """Synchronize lock states with the API and return what changed.
+
+        If *max_age* is given, the request is skipped when every lock was
+        confirmed (by a previous sync or a webhook) within the last *max_age*
+        seconds.  Concurrent calls share a single request and its result.
+        """
+        if max_age is not None and self._is_fresh(max_age):
+            _LOGGER.debug("All locks fresher than %ss, skipping sync", max_age)
+            return []
+        return await self._single_flight("sync", self._sync)
+
+    async def _sync(self) -> list[TedeeLockChange]:
         _LOGGER.debug("Syncing locks")
         result, is_local = await self._fetch_sync()
         if result is None:
             raise TedeeClientException("No data returned from sync")
 
-        for lock_json in self._filter_by_bridge(result):
-            lock_id: int = lock_json["id"]
-            lock = self._locks.get(lock_id)
-            if lock is None:
-                continue
-            lock.update_from_api_response(lock_json, include_settings=is_local)
-
-        _LOGGER.debug("Locks synced successfully")
+        changes: list[TedeeLockChange] = []
+        now = time.monotonic()
+        for lock, fields in TedeeLock.update_many(
+            self._locks,
+            self._filter_by_bridge(result),
+            include_settings=is_local,
+            local=is_local,
+        ):
+            self._last_confirmed[lock.id] = now
+            if change := self._commit_change(lock, fields):
+                changes.append(change)
+
+        _LOGGER.debug("Locks synced successfully, %s changed", len(changes))
+        return changes
+
+    async def sync_lock(self, lock_id: int) -> TedeeLockChange | None:
+        """Synchronize a single lock with the API and return what changed."""
+        return await self._single_flight(
+            ("sync_lock", lock_id), lambda: self._sync_lock(lock_id)
+        )
+
+    async def _sync_lock(self, lock_id: int) -> TedeeLockChange | None:
+        lock_json, is_local = await self._fetch_lock(lock_id)
+        lock = self._locks.get(lock_id)
+        if lock is None:
+            return None
+        fields = lock.update_from_api_response(lock_json, include_settings=is_local)
+        self._last_confirmed[lock_id] = time.monotonic()
+        return self._commit_change(lock, fields)
+
+    # -- Snapshots -------------------------------------------------------------
+
+    async def save_snapshot(self, path: str | os.PathLike[str]) -> None:
+        """Write the known lock states to *path*.
+
+        The file is replaced atomically, so a crash while saving never leaves
+        a truncated snapshot behind.
+        """
+        data = self._json_dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "locks": [lock.to_dict() for lock in self._locks.values()],
+            }
+        )
+        await asyncio.to_thread(_write_atomic, os.fspath(path), data)
+        _LOGGER.debug("Saved snapshot of %s locks to %s", len(self._locks), path)
+
+    async def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Restore lock states from a snapshot at *path*.
+
+        Restored locks are served right away but count as unconfirmed, so
+        :meth:`lock_age` returns None and ``sync(max_age=...)`` refreshes
+        them.  Call :meth:`get_locks` in the background to pick up locks
+        added since the snapshot was taken.  Returns the number of restored
+        locks, 0 if there is no snapshot at *path*.
+
+        Raises:
+            TedeeClientException: If the snapshot is unreadable or invalid.
+        """
+        try:
+            content = await asyncio.to_thread(_read_file, os.fspath(path))
+        except FileNotFoundError:
+            _LOGGER.debug("No snapshot found at %s", path)
+            return 0
+        except OSError as ex:
+            raise TedeeClientException(f"Unable to read snapshot {path}: {ex}") from ex
+        try:
+            snapshot = self._json_loads(content)
+            if snapshot["version"] != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported version {snapshot['version']}")
+            locks = [TedeeLock.from_dict(lock) for lock in snapshot["locks"]]
+        except (LookupError, TypeError, ValueError) as ex:
+            raise TedeeClientException(f"Invalid snapshot {path}: {ex}") from ex
+
+        for lock in locks:
+            self._locks[lock.id] = lock
+            self._last_confirmed.pop(lock.id, None)
+            self._index.add(lock)
+            if self._state_table is not None:
+                self._state_table.upsert(lock, self._state_table_key)
+        _LOGGER.debug("Loaded snapshot of %s locks from %s", len(locks), path)
+        return len(locks)
 
     # -- Lock operations -------------------------------------------------------
 
     async def unlock(self, lock_id: int) -> None:
         """Unlock a lock."""
         _LOGGER.debug("Unlock lock %s...", lock_id)
-        await self._execute_lock_operation(lock_id, "unlock?mode=3")
-        _LOGGER.debug("Unlock command successful, id: %s", lock_id)
-        await asyncio.sleep(UNLOCK_DELAY)
+        await self._operate(
+            lock_id,
+            "unlock?mode=3",
+            _StateWaiter(frozenset({TedeeLockState.UNLOCKED})),
+            UNLOCK_DELAY,
+        )
 
     async def lock(self, lock_id: int) -> None:
         """Lock a lock."""
         _LOGGER.debug("Lock lock %s...", lock_id)
-        await self._execute_lock_operation(lock_id, "lock")
-        _LOGGER.debug("Lock command successful, id: %s", lock_id)
-        await asyncio.sleep(LOCK_DELAY)
+        await self._operate(
+            lock_id,
+            "lock",
+            _StateWaiter(frozenset({TedeeLockState.LOCKED})),
+            LOCK_DELAY,
+        )
 
     async def open(self, lock_id: int) -> None:
         """Unlock and pull the door latch."""
         delay = self._locks[lock_id].duration_pullspring + 1
         _LOGGER.debug("Open lock %s...", lock_id)
-        await self._execute_lock_operation(lock_id, "unlock?mode=4")
-        _LOGGER.debug("Open command successful, id: %s", lock_id)
-        await asyncio.sleep(delay)
+        await self._operate(
+            lock_id,
+            "unlock?mode=4",
+            _StateWaiter(frozenset({TedeeLockState.UNLOCKED}), _PULL_STATES),
+            delay,
+        )
 
     async def pull(self, lock_id: int) -> None:
         """Pull the door latch only."""
         delay = self._locks[lock_id].duration_pullspring + 1
         _LOGGER.debug("Pull lock %s...", lock_id)
-        await self._execute_lock_operation(lock_id, "pull")
-        _LOGGER.debug("Pull command successful, id: %s", lock_id)
-        await asyncio.sleep(delay)
+        await self._operate(
+            lock_id,
+            "pull",
+            _StateWaiter(frozenset({TedeeLockState.UNLOCKED}), _PULL_STATES),
+            delay,
+        )
 
     def is_unlocked(self, lock_id: int) -> bool:
         """Return whether a lock is unlocked."""
@@ -125,51 +420,268 @@ class TedeeClientBase:
 
     # -- Webhooks (parsing only; management methods live in TedeeLocalClient) --
 
-    def parse_webhook_message(self, message: dict) -> None:
-        """Parse a webhook message sent from the bridge."""
+    def parse_webhook_message(self, message: dict) -> TedeeLockChange | None:
+        """Parse a webhook message sent from the bridge.
+
+        Returns the changes applied to the lock, or None if nothing changed.
+        """
+        resolved = self._resolve_webhook(message)
+        if resolved is None:
+            return None
+        lock, handler, data = resolved
+        fields = handler(lock, data)
+        self._last_confirmed[lock.id] = time.monotonic()
+        return self._commit_change(lock, fields)
+
+    def parse_webhook_raw(self, body: bytes | str) -> TedeeLockChange | None:
+        """Decode a raw webhook body and parse it.
+
+        The body is decoded with :meth:`decode_webhook` and then handled like
+        :meth:`parse_webhook_message`; the speedup over decoding with
+        :func:`json.loads` comes from the faster decoder.
+        """
+        return self.parse_webhook_message(self.decode_webhook(body))
+
+    def decode_webhook(self, body: bytes | str) -> dict:
+        """Decode a raw webhook body with the client's JSON decoder.
+
+        The decoder is ``orjson`` or ``msgspec`` when installed, unless one
+        was passed as *json_loads*.
+
+        Raises:
+            TedeeWebhookException: If the body is not a JSON object.
+        """
+        try:
+            message = self._json_loads(body)
+        except ValueError as ex:
+            raise TedeeWebhookException("Invalid webhook body.") from ex
+        if not isinstance(message, dict):
+            raise TedeeWebhookException("Invalid webhook body.")
+        return message
+
+    def parse_webhook_messages(
+        self, messages: Iterable[dict]
+    ) -> list[TedeeLockChange]:
+        """Parse a batch of webhook messages, applying each lock's state once.
+
+        Events are merged per lock with the last event of each type winning.
+        Every handler sets absolute values, so applying the last event of each
+        type in the order of their last occurrence yields the same state as
+        applying all events one by one.  Each lock is then updated and its
+        listeners notified at most once.  Pending lock operations still see
+        every reported state, including intermediate ones such as PULLING.
+        Malformed messages are skipped.
+        """
+        pending: dict[int, dict[WebhookHandler, dict]] = {}
+        for message in messages:
+            try:
+                resolved = self._resolve_webhook(message)
+            except TedeeWebhookException as ex:
+                _LOGGER.debug("Skipping webhook message %r: %s", message, ex)
+                continue
+            if resolved is None:
+                continue
+            lock, handler, data = resolved
+            if (waiters := self._state_waiters.get(lock.id)) and (
+                state := webhook_lock_state(handler, data)
+            ) is not None:
+                for waiter in waiters:
+                    waiter.observe(state)
+            events = pending.setdefault(lock.id, {})
+            events.pop(handler, None)
+            events[handler] = data
+
+        changes: list[TedeeLockChange] = []
+        now = time.monotonic()
+        for lock_id, events in pending.items():
+            lock = self._locks[lock_id]
+            fields: FieldChanges = {}
+            for handler, data in events.items():
+                for name, (old, new) in handler(lock, data).items():
+                    if name in fields:
+                        old = fields[name][0]
+                    fields[name] = (old, new)
+            self._last_confirmed[lock_id] = now
+            fields = {
+                name: (old, new) for name, (old, new) in fields.items() if old != new
+            }
+            if change := self._commit_change(lock, fields):
+                changes.append(change)
+        return changes
+
+    # -- Internal helpers ------------------------------------------------------
+
+    def _resolve_webhook(
+        self, message: dict
+    ) -> tuple[TedeeLock, WebhookHandler, dict] | None:
+        """Return lock, handler and data of a message, or None to ignore it."""
+        if not isinstance(message, dict):
+            raise TedeeWebhookException("Webhook message is not an object.")
         event = message.get("event")
         data = message.get("data")
 
         if data is None:
             raise TedeeWebhookException("No data in webhook message.")
+        if not isinstance(data, dict) or not isinstance(event, str):
+            raise TedeeWebhookException("Malformed webhook message.")
         if event == "backend-connection-changed":
-            return
+            return None
 
-        lock_id: int = data.get("deviceId", 0)
-        lock = self._locks.get(lock_id)
+        lock_id = data.get("deviceId", 0)
+        lock = self._locks.get(lock_id) if isinstance(lock_id, int) else None
         if lock is None:
-            return
+            return None
 
         handler = WEBHOOK_HANDLERS.get(event)
         if handler is None:
             _LOGGER.debug("Unknown webhook event: %s", event)
-            return
-        handler(lock, data)
-        self._locks[lock_id] = lock
-
-    # -- Internal helpers ------------------------------------------------------
-
-    def _filter_by_bridge(self, locks: list[dict]) -> list[dict]:
-        """Filter lock dicts to those belonging to the configured bridge."""
-        if not self._bridge_id:
-            return locks
+            return None
+        return lock, handler, data
+
+    def _commit_change(
+        self, lock: TedeeLock, fields: FieldChanges
+    ) -> TedeeLockChange | None:
+        """Propagate an update of *lock* and return it as a change set."""
+        self._notify_state_waiters(lock)
+        if not fields:
+            return None
+        self._index.update(lock, fields)
+        if self._state_table is not None:
+            self._state_table.upsert(lock, self._state_table_key)
+        change = TedeeLockChange(lock.id, fields)
+        for listener in (
+            *self._listeners.get(lock.id, ()),
+            *self._listeners.get(None, ()),
+        ):
+            try:
+                listener(lock, change)
+            except Exception:  # noqa: BLE001 - isolate faulty listeners
+                _LOGGER.exception("Error in listener for lock %s", lock.id)
+        return change
+
+    def _is_fresh(self, max_age: float) -> bool:
+        """Return whether every lock was confirmed within *max_age* seconds."""
+        if not self._locks:
+            return False
+        oldest = time.monotonic() - max_age
+        return all(
+            self._last_confirmed.get(lock_id, float("-inf")) >= oldest
+            for lock_id in self._locks
+        )
+
+    async def _single_flight(
+        self, key: Hashable, factory: Callable[[], Coroutine[Any, Any, _T]]
+    ) -> _T:
+        """Run *factory* once for all concurrent callers sharing *key*.
+
+        Callers arriving while a call is in flight await that call instead of
+        starting their own.  The shared call is shielded, so cancelling one
+        caller does not cancel it for the others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+
+            def _done(_: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+            future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+    async def _operate(
+        self,
+        lock_id: int,
+        action: str,
+        waiter: _StateWaiter,
+        max_delay: float,
+    ) -> None:
+        """Execute a lock operation and wait until it has completed.
+
+        The operation counts as completed once the lock is seen in the target
+        state, either through a webhook, a sync or a targeted poll of the lock
+        every ``operation_poll_interval`` seconds.  *max_delay* is an upper
+        bound after which the method returns regardless.
+        """
+        waiters = self._state_waiters.setdefault(lock_id, [])
+        waiters.append(waiter)
+        try:
+            await self._execute_lock_operation(lock_id, action)
+            _LOGGER.debug("Command %s successful, id: %s", action, lock_id)
+            await self._wait_for_state(lock_id, waiter, max_delay)
+        finally:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._state_waiters[lock_id]
+
+    async def _wait_for_state(
+        self, lock_id: int, waiter: _StateWaiter, max_delay: float
+    ) -> None:
+        """Wait for *waiter* to resolve, polling the lock in between."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_delay
+        while (remaining := deadline - loop.time()) > 0:
+            interval = self._operation_poll_interval
+            wait_time = remaining if interval is None else min(interval, remaining)
+            done, _ = await asyncio.wait({waiter.future}, timeout=wait_time)
+            if done:
+                return
+            if interval is None:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self.sync_lock(lock_id), deadline - loop.time()
+                )
+            except (TedeeException, TimeoutError) as ex:
+                _LOGGER.debug("Polling lock %s failed: %s", lock_id, ex)
+            if waiter.future.done():
+                return
+        _LOGGER.debug("Lock %s did not reach target state in time", lock_id)
+
+    def _notify_state_waiters(self, lock: TedeeLock) -> None:
+        """Feed the current state of *lock* to pending operations."""
+        for waiter in self._state_waiters.get(lock.id, ()):
+            waiter.observe(lock.state)
+
+    def _create_session(self) -> ClientSession:
+        """Create the session used when none was passed in."""
+        return ClientSession()
+
+    def _lookup(self, field: str, value: Any) -> list[TedeeLock]:
+        """Return the registered locks indexed under *field* == *value*."""
+        locks = self._locks
         return [
-            lock
-            for lock in locks
-            if lock.get("connectedToId") is None
-            or lock.get("connectedToId") == self._bridge_id
+            locks[lock_id]
+            for lock_id in self._index.get(field, value)
+            if lock_id in locks
         ]
 
+    def _filter_by_bridge(self, locks: list[dict]) -> Iterator[dict]:
+        """Yield the lock dicts belonging to the configured bridge."""
+        bridge_id = self._bridge_id
+        if not bridge_id:
+            yield from locks
+            return
+        for lock in locks:
+            connected_to = lock.get("connectedToId")
+            if connected_to is None or connected_to == bridge_id:
+                yield lock
+
     # -- Abstract transport methods (subclasses must implement) ----------------
 
     @abstractmethod
-    async def _fetch_locks(self) -> list[dict]:
-        """Fetch raw lock data from the API."""
+    async def _fetch_locks(self) -> tuple[list[dict], bool]:
+        """Fetch raw lock data from the API. Returns ``(data, is_local)``."""
 
     @abstractmethod
     async def _fetch_sync(self) -> tuple[list[dict], bool]:
         """Fetch sync data. Returns ``(data, is_local)``."""
 
+    @abstractmethod
+    async def _fetch_lock(self, lock_id: int) -> tuple[dict, bool]:
+        """Fetch data of a single lock. Returns ``(data, is_local)``."""
+
     @abstractmethod
     async def _execute_lock_operation(
         self,
@@ -177,3 +689,24 @@ class TedeeClientBase:
         action: str,
     ) -> None:
         """Execute a single lock command (unlock/lock/open/pull)."""
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write *data* to a temporary file next to *path* and move it in place."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".snapshot-"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
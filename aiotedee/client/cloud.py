@@ -9,6 +9,7 @@ from typing import Any
 from ..const import API_URL_BRIDGE, API_URL_LOCK, API_URL_SYNC
 from ..helpers import http_request
 from ..models import TedeeBridge
+from ..scheduler import RequestPriority, RequestScheduler
 from .base import TedeeClientBase
 
 _LOGGER = logging.getLogger(__name__)
@@ -18,52 +19,56 @@ class TedeeCloudClient(TedeeClientBase):
     """Client for the Tedee cloud API.
 
     Use this for cloud-only access (e.g. listing all bridges, operating locks
-    via the cloud).
+    via the cloud).  Requests go through a :class:`RequestScheduler` shared by
+    all clients using the same personal key, so lock operations are sent ahead
+    of polling and rate limits are respected across clients.
     """
 
-    def __init__(self, *, personal_token: str, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *,
+        personal_token: str,
+        scheduler: RequestScheduler | None = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
         self._personal_token = personal_token
         self._cloud_headers: dict[str, str] = {
             "Content-Type": "application/json",
             "Authorization": f"PersonalKey {personal_token}",
         }
+        self._scheduler = scheduler or RequestScheduler.for_key(personal_token)
 
     # -- Transport implementations ---------------------------------------------
 
-    async def _fetch_locks(self) -> list[dict]:
-        r = await http_request(
-            API_URL_LOCK,
-            HTTPMethod.GET,
-            self._cloud_headers,
-            self._session,
-            self._timeout,
+    async def _fetch_locks(self) -> tuple[list[dict], bool]:
+        r = await self._cloud_request(
+            API_URL_LOCK, HTTPMethod.GET, RequestPriority.BACKGROUND
         )
-        return r["result"] if isinstance(r, dict) else r
+        result = r["result"] if isinstance(r, dict) else r
+        return result, False  # is_local = False
 
     async def _fetch_sync(self) -> tuple[list[dict], bool]:
-        r = await http_request(
-            API_URL_SYNC,
-            HTTPMethod.GET,
-            self._cloud_headers,
-            self._session,
-            self._timeout,
+        r = await self._cloud_request(
+            API_URL_SYNC, HTTPMethod.GET, RequestPriority.POLL
         )
         result = r["result"] if isinstance(r, dict) else r
         return result, False  # is_local = False
 
+    async def _fetch_lock(self, lock_id: int) -> tuple[dict, bool]:
+        r = await self._cloud_request(
+            f"{API_URL_LOCK}{lock_id}/sync", HTTPMethod.GET, RequestPriority.POLL
+        )
+        return r["result"], False  # is_local = False
+
     async def _execute_lock_operation(
         self,
         lock_id: int,
         action: str,
     ) -> None:
         url = f"{API_URL_LOCK}{lock_id}/operation/{action}"
-        await http_request(
-            url,
-            HTTPMethod.POST,
-            self._cloud_headers,
-            self._session,
-            self._timeout,
+        await self._cloud_request(
+            url, HTTPMethod.POST, RequestPriority.LOCK_OPERATION
         )
 
     # -- Cloud-only methods ----------------------------------------------------
@@ -71,13 +76,29 @@ class TedeeCloudClient(TedeeClientBase):
     async def get_bridges(self) -> list[TedeeBridge]:
         """List all bridges from the cloud API."""
         _LOGGER.debug("Getting bridges...")
-        r = await http_request(
-            API_URL_BRIDGE,
-            HTTPMethod.GET,
-            self._cloud_headers,
-            self._session,
-            self._timeout,
+        r = await self._cloud_request(
+            API_URL_BRIDGE, HTTPMethod.GET, RequestPriority.BACKGROUND
         )
         bridges = [TedeeBridge.from_api_response(b) for b in r["result"]]
         _LOGGER.debug("Bridges retrieved successfully")
         return bridges
+
+    # -- Cloud API infrastructure ----------------------------------------------
+
+    async def _cloud_request(
+        self, url: str, http_method: str, priority: RequestPriority
+    ) -> Any:
+        """Call the cloud API through the request scheduler."""
+        return await self._scheduler.run(
+            priority,
+            lambda: http_request(
+                url,
+                http_method,
+                self._cloud_headers,
+                self.session,
+                self._timeout,
+                rate_limiter=self._rate_limiter,
+                json_loads=self._json_loads,
+                json_dumps=self._json_dumps,
+            ),
+        )
@@ -3,27 +3,43 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import ipaddress
 import logging
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from http import HTTPMethod
 from typing import Any
 
-from ..const import API_LOCAL_PORT, API_LOCAL_VERSION, NUM_RETRIES
+from aiohttp import ClientResponse, ClientSession, TCPConnector
+
+from ..auth import LocalTokenProvider
+from ..const import (
+    API_LOCAL_PORT,
+    API_LOCAL_VERSION,
+    HEARTBEAT_INTERVAL,
+    KEEPALIVE_TIMEOUT,
+    LOCAL_CONNECTION_LIMIT,
+)
 from ..exceptions import (
     TedeeAuthException,
     TedeeClientException,
     TedeeDataUpdateException,
+    TedeeException,
     TedeeLocalAuthException,
     TedeeRateLimitException,
     TedeeWebhookException,
 )
 from ..helpers import http_request
 from ..models import TedeeBridge
+from ..retry import RetryPolicy
 from .base import TedeeClientBase
 
 _LOGGER = logging.getLogger(__name__)
 
+_PROBE_POLICY = RetryPolicy(max_attempts=1)
+
 
 class TedeeLocalClient(TedeeClientBase):
     """Client for the local Tedee bridge API.
@@ -38,25 +54,68 @@ class TedeeLocalClient(TedeeClientBase):
         *,
         local_token: str,
         local_ip: str,
+        local_port: int | str = API_LOCAL_PORT,
         api_token_mode_plain: bool = False,
+        retry_policy: RetryPolicy | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self._local_token = local_token
         self._local_ip = local_ip
         self._api_token_mode_plain = api_token_mode_plain
+        self._token_provider = LocalTokenProvider(local_token)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._scoped_retry_policy: ContextVar[RetryPolicy | None] = ContextVar(
+            f"tedee_retry_policy_{id(self)}", default=None
+        )
         self._use_local_api: bool = bool(local_token and local_ip)
         self._local_api_base: str = (
-            f"http://{local_ip}:{API_LOCAL_PORT}/{API_LOCAL_VERSION}"
+            f"http://{local_ip}:{local_port}/{API_LOCAL_VERSION}"
         )
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._latency: float | None = None
+        self._degraded = False
+
+    # -- Public properties -----------------------------------------------------
+
+    @property
+    def latency(self) -> float | None:
+        """Return the round-trip time of the last successful probe."""
+        return self._latency
+
+    @property
+    def is_degraded(self) -> bool:
+        """Return whether the last probe of the bridge failed."""
+        return self._degraded
+
+    # -- Retry policy ------------------------------------------------------------
+
+    @contextmanager
+    def use_retry_policy(self, policy: RetryPolicy) -> Iterator[None]:
+        """Apply *policy* to the calls made by this client within the block.
+
+        The override is scoped to the current task, so concurrent callers
+        keep their own policy::
+
+            with client.use_retry_policy(RetryPolicy(max_attempts=1)):
+                await client.unlock(lock_id)
+
+        Calls of :meth:`get_locks` and :meth:`sync` that join a call already
+        in flight use the policy of the caller that started it.
+        """
+        token = self._scoped_retry_policy.set(policy)
+        try:
+            yield
+        finally:
+            self._scoped_retry_policy.reset(token)
 
     # -- Transport implementations ---------------------------------------------
 
-    async def _fetch_locks(self) -> list[dict]:
+    async def _fetch_locks(self) -> tuple[list[dict], bool]:
         success, result = await self._local_api_call("/lock", HTTPMethod.GET)
         if not success or result is None:
             raise TedeeClientException("No data returned from local API")
-        return result
+        return result, True  # is_local = True
 
     async def _fetch_sync(self) -> tuple[list[dict], bool]:
         success, result = await self._local_api_call("/lock", HTTPMethod.GET)
@@ -64,6 +123,14 @@ class TedeeLocalClient(TedeeClientBase):
             raise TedeeClientException("No data returned from local API")
         return result, True  # is_local = True
 
+    async def _fetch_lock(self, lock_id: int) -> tuple[dict, bool]:
+        success, result = await self._local_api_call(
+            f"/lock/{lock_id}", HTTPMethod.GET
+        )
+        if not success or result is None:
+            raise TedeeClientException("No data returned from local API")
+        return result, True  # is_local = True
+
     async def _execute_lock_operation(
         self,
         lock_id: int,
@@ -87,6 +154,55 @@ class TedeeLocalClient(TedeeClientBase):
             raise TedeeClientException("Unable to get local bridge")
         return TedeeBridge.from_api_response(result)
 
+    async def ping(self) -> float:
+        """Probe the bridge once and return the round-trip time in seconds.
+
+        The probe is not retried, so a failure marks the bridge degraded
+        right away.  A successful probe clears the degraded flag.
+        """
+        start = time.monotonic()
+        try:
+            success, _ = await self._local_api_call(
+                "/bridge", HTTPMethod.GET, retry_policy=_PROBE_POLICY
+            )
+            if not success:
+                raise TedeeClientException("Local API not configured.")
+        except TedeeException:
+            if not self._degraded:
+                _LOGGER.warning("Bridge %s is not responding", self._local_ip)
+            self._degraded = True
+            raise
+        self._latency = time.monotonic() - start
+        if self._degraded:
+            _LOGGER.info("Bridge %s is responding again", self._local_ip)
+        self._degraded = False
+        return self._latency
+
+    def start_heartbeat(self, interval: float = HEARTBEAT_INTERVAL) -> None:
+        """Probe the bridge every *interval* seconds in the background.
+
+        Besides tracking :attr:`latency` and :attr:`is_degraded`, this keeps
+        a pooled connection to the bridge warm, so lock operations after an
+        idle period do not pay for connection setup.  *interval* should stay
+        below the keep-alive timeout of the connection.
+        """
+        if self._heartbeat is not None and not self._heartbeat.done():
+            return
+        self._heartbeat = asyncio.create_task(self._run_heartbeat(interval))
+
+    async def stop_heartbeat(self) -> None:
+        """Stop the background heartbeat."""
+        if self._heartbeat is None:
+            return
+        self._heartbeat.cancel()
+        await asyncio.gather(self._heartbeat, return_exceptions=True)
+        self._heartbeat = None
+
+    async def close(self) -> None:
+        """Stop the heartbeat and close the HTTP session if owned."""
+        await self.stop_heartbeat()
+        await super().close()
+
     # -- Local-only: webhook management ----------------------------------------
 
     async def update_webhooks(
@@ -169,50 +285,110 @@ class TedeeLocalClient(TedeeClientBase):
 
     # -- Local API infrastructure ----------------------------------------------
 
+    async def _run_heartbeat(self, interval: float) -> None:
+        while True:
+            try:
+                await self.ping()
+            except TedeeException as ex:
+                _LOGGER.debug("Bridge probe failed: %s", ex)
+            await asyncio.sleep(interval)
+
+    def _create_session(self) -> ClientSession:
+        """Create a session with a connector tuned for the single bridge.
+
+        Connections are kept alive between calls and capped per host, since
+        the bridge only serves a few of them.  DNS caching is pointless for
+        an IP literal and is turned off in that case.
+        """
+        try:
+            ipaddress.ip_address(self._local_ip)
+        except ValueError:
+            is_ip_literal = False
+        else:
+            is_ip_literal = True
+        connector = TCPConnector(
+            limit_per_host=LOCAL_CONNECTION_LIMIT,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            use_dns_cache=not is_ip_literal,
+        )
+        return ClientSession(connector=connector)
+
     async def _local_api_call(
-        self, path: str, http_method: str, json_data: Any = None
+        self,
+        path: str,
+        http_method: str,
+        json_data: Any = None,
+        *,
+        retry_policy: RetryPolicy | None = None,
     ) -> tuple[bool, Any | None]:
         """Call the local bridge API with retries.
 
+        Failed calls are retried according to *retry_policy*, defaulting to
+        the policy set with :meth:`use_retry_policy`, then the policy of the
+        client.  A rejected token is retried once right
+        away with a timestamp corrected for the bridge clock.
+
         Returns:
             A tuple of (success, response_data).
         """
         if not self._use_local_api:
             return False, None
 
-        for attempt in range(1, NUM_RETRIES + 1):
+        session = self.session
+        policy = (
+            retry_policy or self._scoped_retry_policy.get() or self._retry_policy
+        )
+        start = time.monotonic()
+        attempt = 0
+        token_refreshed = False
+        while True:
+            attempt += 1
             try:
                 _LOGGER.debug("Local API call: %s %s", http_method, path)
                 result = await http_request(
                     self._local_api_base + path,
                     http_method,
                     self._local_api_header,
-                    self._session,
+                    session,
                     self._timeout,
                     json_data,
+                    rate_limiter=self._rate_limiter,
+                    json_loads=self._json_loads,
+                    json_dumps=self._json_dumps,
+                    response_hook=self._observe_response,
                 )
-            except TedeeAuthException as ex:
-                if attempt == NUM_RETRIES:
-                    raise TedeeLocalAuthException(
-                        "Local API authentication failed."
-                    ) from ex
-                _LOGGER.debug("Local API authentication failed.")
-            except (TedeeClientException, TedeeRateLimitException) as ex:
-                if attempt == NUM_RETRIES:
+            except (
+                TedeeAuthException,
+                TedeeClientException,
+                TedeeRateLimitException,
+            ) as ex:
+                if (
+                    isinstance(ex, TedeeAuthException)
+                    and not token_refreshed
+                    and not self._api_token_mode_plain
+                ):
+                    _LOGGER.debug("Local API token rejected, retrying once")
+                    token_refreshed = True
+                    continue
+                delay = policy.next_delay(ex, attempt, time.monotonic() - start)
+                if delay is None:
+                    if isinstance(ex, TedeeAuthException):
+                        raise TedeeLocalAuthException(
+                            "Local API authentication failed."
+                        ) from ex
                     raise TedeeDataUpdateException(
                         f"Error while calling local API endpoint {path}."
                     ) from ex
                 _LOGGER.debug(
-                    "Error calling local API %s, retrying. Error: %s",
+                    "Error calling local API %s, retrying in %.2fs. Error: %s",
                     path,
+                    delay,
                     type(ex).__name__,
                     exc_info=True,
                 )
+                await asyncio.sleep(delay)
             else:
                 return True, result
-            await asyncio.sleep(0.5)
-
-        return False, None
 
     @property
     def _local_api_header(self) -> dict[str, str]:
@@ -222,7 +398,10 @@ class TedeeLocalClient(TedeeClientBase):
         if self._api_token_mode_plain:
             token = self._local_token
         else:
-            ms = time.time_ns() // 1_000_000
-            raw = f"{self._local_token}{ms}"
-            token = hashlib.sha256(raw.encode()).hexdigest() + str(ms)
+            token = self._token_provider.token()
         return {"Content-Type": "application/json", "api_token": token}
+
+    def _observe_response(self, response: ClientResponse) -> None:
+        """Track the bridge clock from the ``Date`` header of *response*."""
+        if not self._api_token_mode_plain:
+            self._token_provider.observe_date(response.headers.get("Date"))
@@ -0,0 +1,69 @@
+"""JSON codec selection for aiotedee.
+
+The fastest available codec is used by default: ``orjson`` if installed,
+then ``msgspec``, falling back to the standard library.  All decoders raise
+:class:`ValueError` on invalid input and all encoders return bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+JsonLoads = Callable[[bytes | str], Any]
+JsonDumps = Callable[[Any], bytes]
+
+
+def _detect_loads() -> JsonLoads:
+    """Return the fastest installed JSON decoder."""
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        decode = msgspec.json.decode
+
+        def _msgspec_loads(data: bytes | str) -> Any:
+            try:
+                return decode(data)
+            except msgspec.DecodeError as ex:
+                raise ValueError(str(ex)) from ex
+
+        return _msgspec_loads
+
+    return json.loads
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _detect_dumps() -> JsonDumps:
+    """Return the fastest installed JSON encoder."""
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        return orjson.dumps
+
+    try:
+        import msgspec  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.encode
+
+    return _stdlib_dumps
+
+
+json_loads: JsonLoads = _detect_loads()
+json_dumps: JsonDumps = _detect_dumps()
@@ -1,6 +1,7 @@
 """Constants for aiotedee."""
 
-API_URL_BASE = "https://api.tedee.com/api/v1.32/"
+API_HOST = "api.tedee.com"
+API_URL_BASE = f"https://{API_HOST}/api/v1.32/"
 API_URL_DEVICE = API_URL_BASE + "my/device/"
 API_URL_LOCK = API_URL_BASE + "my/lock/"
 API_URL_SYNC = API_URL_LOCK + "sync"
@@ -14,7 +15,34 @@ API_LOCAL_VERSION = "v1.0"
 API_LOCAL_PORT = "80"
 
 TIMEOUT = 10
+LOCAL_CONNECTION_LIMIT = 2
+KEEPALIVE_TIMEOUT = 30
+HEARTBEAT_INTERVAL = 20
 UNLOCK_DELAY = 5
 LOCK_DELAY = 5
+OPERATION_POLL_INTERVAL = 1
 
 NUM_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5
+
+RATE_LIMIT = 10
+RATE_LIMIT_BURST = 10
+CLOUD_RATE_LIMIT = 10
+CLOUD_RATE_LIMIT_BURST = 20
+CLOUD_MAX_CONCURRENT_REQUESTS = 4
+RATE_LIMIT_BACKOFF = 1
+RATE_LIMIT_MAX_BACKOFF = 60
+
+FLEET_MAX_CONCURRENCY = 10
+
+SNAPSHOT_VERSION = 1
+
+WEBHOOK_SERVER_PORT = 8080
+WEBHOOK_SERVER_PATH = "/tedee"
+WEBHOOK_SECRET_HEADER = "X-Tedee-Secret"
+WEBHOOK_QUEUE_SIZE = 1000
+WEBHOOK_WORKERS = 1
+
+SIMULATOR_OPERATION_TIME = 1
+SIMULATOR_TOKEN_MAX_AGE = 60
@@ -1,5 +1,8 @@
 """Exceptions for aiotedee."""
 
+from __future__ import annotations
+
+
 class TedeeException(Exception):
     """Base exception for aiotedee."""
 
@@ -7,6 +10,18 @@ class TedeeClientException(TedeeException):
     """General Tedee client exception."""
 
 
+class TedeeNotFoundException(TedeeClientException):
+    """Requested resource does not exist (HTTP 404)."""
+
+
+class TedeeConflictException(TedeeClientException):
+    """Request conflicts with the current device state (HTTP 409)."""
+
+
+class TedeeTimeoutException(TedeeClientException):
+    """Request timed out."""
+
+
 class TedeeAuthException(TedeeException):
     """Authentication exception against remote API."""
 
@@ -18,6 +33,10 @@ class TedeeLocalAuthException(TedeeException):
 class TedeeRateLimitException(TedeeException):
     """Rate limit exception (only happens on cloud API)."""
 
+    def __init__(self, message: str = "", retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class TedeeWebhookException(TedeeException):
     """Webhook exception."""
@@ -0,0 +1,126 @@
+"""Fleet manager running many Tedee clients concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Hashable, Mapping
+
+from .client.base import TedeeClientBase
+from .const import FLEET_MAX_CONCURRENCY, TIMEOUT
+from .models import TedeeLock
+from .table import LockStateTable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TedeeFleet:
+    """Manage many local and cloud clients as one fleet.
+
+    Each client is registered under a bridge key (usually the bridge ID).
+    :meth:`get_locks` and :meth:`sync` run across all clients at once, bounded
+    by *max_concurrency*, and every client call is cut off after *timeout*
+    seconds so a single slow bridge cannot hold up the whole refresh.
+    Failures are collected per bridge instead of being raised.  All clients
+    share one :class:`LockStateTable` for fleet-wide queries, whose results
+    are ``(bridge, lock_id)`` keys like those of :attr:`locks`.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[Hashable, TedeeClientBase] | None = None,
+        *,
+        max_concurrency: int = FLEET_MAX_CONCURRENCY,
+        timeout: float = TIMEOUT,
+    ) -> None:
+        self._clients: dict[Hashable, TedeeClientBase] = {}
+        self._errors: dict[Hashable, Exception] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._timeout = timeout
+        self._state_table = LockStateTable()
+        for bridge, client in (clients or {}).items():
+            self.add_client(bridge, client)
+
+    # -- Public properties -----------------------------------------------------
+
+    @property
+    def clients(self) -> dict[Hashable, TedeeClientBase]:
+        """Return all clients keyed by bridge."""
+        return self._clients
+
+    @property
+    def errors(self) -> dict[Hashable, Exception]:
+        """Return the error of the last run for each failed bridge."""
+        return self._errors
+
+    @property
+    def state_table(self) -> LockStateTable:
+        """Return the columnar state table shared by all clients."""
+        return self._state_table
+
+    @property
+    def locks(self) -> dict[tuple[Hashable, int], TedeeLock]:
+        """Return all locks of the fleet keyed by ``(bridge, lock_id)``."""
+        return {
+            (bridge, lock_id): lock
+            for bridge, client in self._clients.items()
+            for lock_id, lock in client.locks_dict.items()
+        }
+
+    # -- Client registry -------------------------------------------------------
+
+    def add_client(self, bridge: Hashable, client: TedeeClientBase) -> None:
+        """Register a client under *bridge*."""
+        self._clients[bridge] = client
+        client.attach_state_table(self._state_table, bridge)
+
+    def remove_client(self, bridge: Hashable) -> TedeeClientBase:
+        """Unregister and return the client registered under *bridge*."""
+        self._errors.pop(bridge, None)
+        client = self._clients.pop(bridge)
+        client.state_table = None
+        for lock_id in client.locks_dict:
+            self._state_table.remove(lock_id, bridge)
+        return client
+
+    # -- Fleet-wide operations -------------------------------------------------
+
+    async def get_locks(self) -> dict[Hashable, Exception]:
+        """Fetch locks on every client. Returns the failures per bridge."""
+        return await self._run_all("get_locks")
+
+    async def sync(self) -> dict[Hashable, Exception]:
+        """Sync locks on every client. Returns the failures per bridge."""
+        return await self._run_all("sync")
+
+    # -- Internal helpers ------------------------------------------------------
+
+    async def _run_all(self, method: str) -> dict[Hashable, Exception]:
+        """Run *method* on all clients and record failures per bridge."""
+        clients = list(self._clients.items())
+        results = await asyncio.gather(
+            *(self._run(client, method) for _, client in clients)
+        )
+        errors = {
+            bridge: error
+            for (bridge, _), error in zip(clients, results)
+            if error is not None
+        }
+        self._errors = errors
+        _LOGGER.debug(
+            "Fleet %s finished, %s of %s bridges failed",
+            method,
+            len(errors),
+            len(clients),
+        )
+        return errors
+
+    async def _run(self, client: TedeeClientBase, method: str) -> Exception | None:
+        """Run *method* on a single client, returning the error if it fails."""
+        async with self._semaphore:
+            try:
+                await asyncio.wait_for(getattr(client, method)(), self._timeout)
+            except Exception as ex:  # noqa: BLE001 - isolate failing bridges
+                _LOGGER.debug("Fleet %s failed: %s", method, ex)
+                return ex
+        return None
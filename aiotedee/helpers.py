@@ -1,26 +1,41 @@
 """Helper functions for aiotedee."""
 
-import asyncio
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 from typing import Any, Mapping
+from urllib.parse import urlsplit
 
-from aiohttp import ClientError, ClientSession, ServerConnectionError
+from aiohttp import ClientError, ClientResponse, ClientSession, ServerConnectionError
 
-from .const import API_URL_DEVICE, TIMEOUT
+from .codec import (
+    JsonDumps,
+    JsonLoads,
+    json_dumps as default_json_dumps,
+    json_loads as default_json_loads,
+)
+from .const import API_HOST, API_URL_DEVICE, TIMEOUT
 from .exceptions import (
     TedeeAuthException,
     TedeeClientException,
+    TedeeConflictException,
+    TedeeNotFoundException,
     TedeeRateLimitException,
+    TedeeTimeoutException,
 )
+from .ratelimit import DEFAULT_RATE_LIMITER, RateLimiter
 
 
 async def is_personal_key_valid(
     personal_key: str,
     session: ClientSession,
     timeout: int = TIMEOUT,
+    rate_limiter: RateLimiter | None = None,
 ) -> bool:
     """Check if personal key is valid."""
 
+    await (rate_limiter or DEFAULT_RATE_LIMITER).acquire(API_HOST)
     try:
         response = await session.get(
             API_URL_DEVICE,
@@ -33,8 +48,6 @@ async def is_personal_key_valid(
     except (ClientError, ServerConnectionError, TimeoutError):
         return False
 
-    await asyncio.sleep(0.1)
-
     if response.status in (
         HTTPStatus.OK,
         HTTPStatus.CREATED,
@@ -51,25 +64,45 @@ async def http_request(
     session: ClientSession,
     timeout: int = TIMEOUT,
     json_data: Any = None,
+    rate_limiter: RateLimiter | None = None,
+    *,
+    json_loads: JsonLoads | None = None,
+    json_dumps: JsonDumps | None = None,
+    response_hook: Callable[[ClientResponse], None] | None = None,
 ) -> Any:
-    """HTTP request wrapper."""
+    """HTTP request wrapper.
 
+    Requests are throttled per host by *rate_limiter*, falling back to a
+    shared default limiter that does not delay requests within budget.
+    Request and response bodies are encoded with *json_dumps* and decoded
+    with *json_loads*, defaulting to the fastest installed JSON codec.
+    *response_hook* is called with every response, including errors.
+    """
+
+    limiter = rate_limiter or DEFAULT_RATE_LIMITER
+    await limiter.acquire(urlsplit(url).hostname or "")
+    body = None
+    if json_data is not None:
+        body = (json_dumps or default_json_dumps)(json_data)
+        headers = {"Content-Type": "application/json", **(headers or {})}
     try:
         response = await session.request(
             http_method,
             url,
             headers=headers,
-            json=json_data,
+            data=body,
             timeout=timeout,
         )
+    except TimeoutError as exc:
+        raise TedeeTimeoutException(f"Timeout during http call: {exc}") from exc
     except (
         ServerConnectionError,
         ClientError,
-        TimeoutError,
     ) as exc:
         raise TedeeClientException(f"Error during http call: {exc}") from exc
 
-    await asyncio.sleep(0.1)
+    if response_hook is not None:
+        response_hook(response)
 
     status_code = response.status
 
@@ -79,16 +112,42 @@ async def http_request(
         HTTPStatus.ACCEPTED,
         HTTPStatus.NO_CONTENT,
     ):
-        return await response.json()
+        content = await response.read()
+        if not content.strip():
+            return None
+        try:
+            return (json_loads or default_json_loads)(content)
+        except ValueError as exc:
+            raise TedeeClientException("Invalid JSON in response.") from exc
     if status_code == HTTPStatus.UNAUTHORIZED:
         raise TedeeAuthException("Authentication failed.")
     if status_code == HTTPStatus.TOO_MANY_REQUESTS:
-        raise TedeeRateLimitException("Tedee API Rate Limit.")
+        raise TedeeRateLimitException(
+            "Tedee API Rate Limit.",
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
     if status_code == HTTPStatus.NOT_FOUND:
-        raise TedeeClientException("Resource not found.")
+        raise TedeeNotFoundException("Resource not found.")
     if status_code == HTTPStatus.NOT_ACCEPTABLE:
         raise TedeeClientException("Request not acceptable.")
     if status_code == HTTPStatus.CONFLICT:
-        raise TedeeClientException("Conflict.")
+        raise TedeeConflictException("Conflict.")
 
     raise TedeeClientException(f"Error during HTTP request. Status code {status_code}")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,81 @@
+"""Secondary indexes over the lock registry of a client."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+from .models import FieldChanges, TedeeLock
+
+INDEXED_FIELDS = ("connected_to_id", "state", "door_state", "is_connected")
+
+
+class LockIndex:
+    """Map indexed field values to the IDs of the locks holding them.
+
+    Locks are indexed on :data:`INDEXED_FIELDS`.  Entries are moved
+    incrementally from the change sets produced by
+    :meth:`TedeeLock.update_fields`, so lookups never scan the registry.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, dict[Hashable, set[int]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        self._keys: dict[int, dict[str, Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, lock_id: object) -> bool:
+        return lock_id in self._keys
+
+    # -- Maintenance -----------------------------------------------------------
+
+    def add(self, lock: TedeeLock) -> None:
+        """Index *lock*, replacing any previous entry for its ID."""
+        self.remove(lock.id)
+        keys = {field: getattr(lock, field) for field in INDEXED_FIELDS}
+        self._keys[lock.id] = keys
+        for field, value in keys.items():
+            self._buckets[field].setdefault(value, set()).add(lock.id)
+
+    def update(self, lock: TedeeLock, changes: FieldChanges) -> None:
+        """Move *lock* to the buckets matching the fields in *changes*."""
+        keys = self._keys.get(lock.id)
+        if keys is None:
+            self.add(lock)
+            return
+        for field in changes.keys() & keys.keys():
+            self._discard(field, keys[field], lock.id)
+            value = keys[field] = getattr(lock, field)
+            self._buckets[field].setdefault(value, set()).add(lock.id)
+
+    def remove(self, lock_id: int) -> None:
+        """Drop *lock_id* from the index."""
+        keys = self._keys.pop(lock_id, None)
+        if keys is None:
+            return
+        for field, value in keys.items():
+            self._discard(field, value, lock_id)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self._keys.clear()
+
+    # -- Queries ---------------------------------------------------------------
+
+    def get(self, field: str, value: Hashable) -> frozenset[int]:
+        """Return the IDs of the locks whose *field* equals *value*."""
+        return frozenset(self._buckets[field].get(value, ()))
+
+    # -- Internal helpers ------------------------------------------------------
+
+    def _discard(self, field: str, value: Hashable, lock_id: int) -> None:
+        bucket = self._buckets[field].get(value)
+        if bucket is None:
+            return
+        bucket.discard(lock_id)
+        if not bucket:
+            del self._buckets[field][value]
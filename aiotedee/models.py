@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from enum import IntEnum
-
-from mashumaro.mixins.dict import DataClassDictMixin
+from operator import attrgetter
+from typing import Any, Mapping
 
 
 # -- Enums ---------------------------------------------------------------------
@@ -56,54 +57,76 @@ class TedeeDeviceType(IntEnum):
 
 DEFAULT_PULLSPRING_DURATION = 5
 
+_LOCK_TYPE_NAMES = {
+    TedeeDeviceType.LOCK_PRO: "Tedee PRO",
+    TedeeDeviceType.LOCK_GO: "Tedee GO",
+}
+
+FieldChanges = dict[str, tuple[Any, Any]]
+"""Changed fields of a model mapped to ``(old, new)`` values."""
+
+
+_LOCK_STATES = {member.value: member for member in TedeeLockState}
+_DEVICE_TYPES = {member.value: member for member in TedeeDeviceType}
+_DOOR_STATES = {member.value: member for member in TedeeDoorState}
+
 
 def _safe_lock_state(value: int) -> TedeeLockState:
     """Convert an int to TedeeLockState, falling back to UNKNOWN."""
     try:
-        return TedeeLockState(value)
-    except ValueError:
+        return _LOCK_STATES.get(value, TedeeLockState.UNKNOWN)
+    except TypeError:  # unhashable value
         return TedeeLockState.UNKNOWN
 
 
 def _safe_device_type(value: int) -> TedeeDeviceType:
     """Convert an int to TedeeDeviceType, falling back to UNKNOWN."""
     try:
-        return TedeeDeviceType(value)
-    except ValueError:
+        return _DEVICE_TYPES.get(value, TedeeDeviceType.UNKNOWN)
+    except TypeError:  # unhashable value
         return TedeeDeviceType.UNKNOWN
 
 
 def _safe_door_state(value: int) -> TedeeDoorState:
     """Convert an int to TedeeDoorState, falling back to NOT_PAIRED."""
     try:
-        return TedeeDoorState(value)
-    except ValueError:
+        return _DOOR_STATES.get(value, TedeeDoorState.NOT_PAIRED)
+    except TypeError:  # unhashable value
         return TedeeDoorState.NOT_PAIRED
 
 
-def _parse_lock_properties(
-    data: dict,
-) -> tuple[TedeeLockState, int | None, bool, int, TedeeDoorState]:
+_LockProperties = tuple[TedeeLockState, int | None, bool, int, TedeeDoorState]
+
+
+def _parse_local_properties(data: dict) -> _LockProperties:
+    """Extract lock state properties from a local API response."""
+    return (
+        _safe_lock_state(data.get("state", TedeeLockState.UNKNOWN)),
+        data.get("batteryLevel"),
+        bool(data.get("isCharging", False)),
+        data.get("jammed", 0),
+        _safe_door_state(data.get("doorState", TedeeDoorState.NOT_PAIRED)),
+    )
+
+
+def _parse_lock_properties(data: dict) -> _LockProperties:
     """Extract lock state properties from an API response.
 
     The cloud API nests values under ``lockProperties`` while the local API
     places them at the top level.
     """
     lock_props = data.get("lockProperties")
-    source = lock_props if lock_props is not None else data
-
-    state = _safe_lock_state(source.get("state", TedeeLockState.UNKNOWN))
-    battery_level: int | None = source.get("batteryLevel")
-    is_charging = bool(source.get("isCharging", False))
-    door_state = _safe_door_state(source.get("doorState", TedeeDoorState.NOT_PAIRED))
+    if lock_props is None:
+        return _parse_local_properties(data)
 
     # The cloud API uses ``stateChangeResult`` while the local API uses ``jammed``.
-    if lock_props is not None:
-        state_change_result: int = source.get("stateChangeResult", 0)
-    else:
-        state_change_result = source.get("jammed", 0)
-
-    return state, battery_level, is_charging, state_change_result, door_state
+    return (
+        _safe_lock_state(lock_props.get("state", TedeeLockState.UNKNOWN)),
+        lock_props.get("batteryLevel"),
+        bool(lock_props.get("isCharging", False)),
+        lock_props.get("stateChangeResult", 0),
+        _safe_door_state(lock_props.get("doorState", TedeeDoorState.NOT_PAIRED)),
+    )
 
 
 def _parse_pull_spring_settings(data: dict) -> tuple[bool, bool, int]:
@@ -116,11 +139,30 @@ def _parse_pull_spring_settings(data: dict) -> tuple[bool, bool, int]:
     )
 
 
+_UPDATE_FIELDS = (
+    "is_connected",
+    "connected_to_id",
+    "state",
+    "battery_level",
+    "is_charging",
+    "state_change_result",
+    "door_state",
+)
+_UPDATE_FIELDS_WITH_SETTINGS = (
+    *_UPDATE_FIELDS,
+    "is_enabled_pullspring",
+    "is_enabled_auto_pullspring",
+    "duration_pullspring",
+)
+_get_update_fields = attrgetter(*_UPDATE_FIELDS)
+_get_with_settings = attrgetter(*_UPDATE_FIELDS_WITH_SETTINGS)
+
+
 # -- Models --------------------------------------------------------------------
 
 
-@dataclass
-class TedeeLock(DataClassDictMixin):
+@dataclass(slots=True)
+class TedeeLock:
     """Tedee Lock."""
 
     name: str
@@ -135,12 +177,64 @@ class TedeeLock(DataClassDictMixin):
     is_enabled_auto_pullspring: bool = False
     duration_pullspring: int = DEFAULT_PULLSPRING_DURATION
     door_state: TedeeDoorState = TedeeDoorState.NOT_PAIRED
+    connected_to_id: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the lock as a dict of plain values."""
+        return {
+            "name": self.name,
+            "id": self.id,
+            "type": int(self.type),
+            "state": int(self.state),
+            "battery_level": self.battery_level,
+            "is_connected": self.is_connected,
+            "is_charging": self.is_charging,
+            "state_change_result": self.state_change_result,
+            "is_enabled_pullspring": self.is_enabled_pullspring,
+            "is_enabled_auto_pullspring": self.is_enabled_auto_pullspring,
+            "duration_pullspring": self.duration_pullspring,
+            "door_state": int(self.door_state),
+            "connected_to_id": self.connected_to_id,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> TedeeLock:
+        """Create a lock from a dict made by :meth:`to_dict`.
+
+        Raises:
+            KeyError: If a required field is missing or an enum value is
+                unknown.
+        """
+        return cls(
+            name=d["name"],
+            id=d["id"],
+            type=_DEVICE_TYPES[d["type"]] if "type" in d else TedeeDeviceType.UNKNOWN,
+            state=(
+                _LOCK_STATES[d["state"]]
+                if "state" in d
+                else TedeeLockState.UNCALIBRATED
+            ),
+            battery_level=d.get("battery_level"),
+            is_connected=d.get("is_connected", False),
+            is_charging=d.get("is_charging", False),
+            state_change_result=d.get("state_change_result", 0),
+            is_enabled_pullspring=d.get("is_enabled_pullspring", False),
+            is_enabled_auto_pullspring=d.get("is_enabled_auto_pullspring", False),
+            duration_pullspring=d.get(
+                "duration_pullspring", DEFAULT_PULLSPRING_DURATION
+            ),
+            door_state=(
+                _DOOR_STATES[d["door_state"]]
+                if "door_state" in d
+                else TedeeDoorState.NOT_PAIRED
+            ),
+            connected_to_id=d.get("connected_to_id"),
+        )
 
     @property
     def type_name(self) -> str:
         """Return the human-readable type of the lock."""
-        _names = {TedeeDeviceType.LOCK_PRO: "Tedee PRO", TedeeDeviceType.LOCK_GO: "Tedee GO"}
-        return _names.get(self.type, "Unknown Model")
+        return _LOCK_TYPE_NAMES.get(self.type, "Unknown Model")
 
     @property
     def is_locked(self) -> bool:
@@ -176,37 +270,141 @@ class TedeeLock(DataClassDictMixin):
             is_enabled_auto_pullspring=auto_pull,
             duration_pullspring=duration,
             door_state=door,
+            connected_to_id=data.get("connectedToId"),
         )
 
+    @classmethod
+    def from_api_responses(
+        cls, payload: Iterable[dict], *, local: bool = False
+    ) -> list[TedeeLock]:
+        """Create locks from the lock dicts of a single API response.
+
+        With *local* set the payload is known to come from the local API and
+        the per-lock check for nested cloud properties is skipped.  Locks are
+        built with positional arguments in field order.
+        """
+        parse = _parse_local_properties if local else _parse_lock_properties
+        settings = _parse_pull_spring_settings
+        device_type = _DEVICE_TYPES.get
+        unknown = TedeeDeviceType.UNKNOWN
+        locks: list[TedeeLock] = []
+        append = locks.append
+        for data in payload:
+            state, battery, charging, change_result, door = parse(data)
+            append(
+                cls(
+                    data["name"],
+                    data["id"],
+                    device_type(data.get("type", 0), unknown),
+                    state,
+                    battery,
+                    bool(data.get("isConnected", False)),
+                    charging,
+                    change_result,
+                    *settings(data),
+                    door,
+                    data.get("connectedToId"),
+                )
+            )
+        return locks
+
     def update_from_api_response(
         self, data: dict, *, include_settings: bool = False
-    ) -> None:
-        """Update this lock in-place from an API response dict."""
-        state, battery, charging, change_result, door = _parse_lock_properties(data)
+    ) -> FieldChanges:
+        """Update this lock in-place from an API response dict.
 
-        self.is_connected = bool(data.get("isConnected", False))
-        self.state = state
-        self.battery_level = battery
-        self.is_charging = charging
-        self.state_change_result = change_result
-        self.door_state = door
+        Returns the fields that changed.
+        """
+        return self._update_from_api_response(
+            data, _parse_lock_properties, include_settings
+        )
 
+    @staticmethod
+    def update_many(
+        locks: Mapping[int, TedeeLock],
+        payload: Iterable[dict],
+        *,
+        include_settings: bool = False,
+        local: bool = False,
+    ) -> list[tuple[TedeeLock, FieldChanges]]:
+        """Update *locks* in-place from the lock dicts of a single API response.
+
+        Lock dicts whose ID is not in *locks* are skipped.  *local* works as
+        for :meth:`from_api_responses`.  Returns every updated lock with the
+        fields that changed.
+        """
+        parse = _parse_local_properties if local else _parse_lock_properties
+        updated: list[tuple[TedeeLock, FieldChanges]] = []
+        for data in payload:
+            lock = locks.get(data["id"])
+            if lock is None:
+                continue
+            changes = lock._update_from_api_response(data, parse, include_settings)
+            updated.append((lock, changes))
+        return updated
+
+    def _update_from_api_response(
+        self,
+        data: dict,
+        parse: Callable[[dict], _LockProperties],
+        include_settings: bool,
+    ) -> FieldChanges:
+        # A missing ``connectedToId`` keeps the current value.
+        values = (
+            bool(data.get("isConnected", False)),
+            data.get("connectedToId", self.connected_to_id),
+            *parse(data),
+        )
         if include_settings:
-            (
-                self.is_enabled_pullspring,
-                self.is_enabled_auto_pullspring,
-                self.duration_pullspring,
-            ) = _parse_pull_spring_settings(data)
-
-
-@dataclass
-class TedeeBridge(DataClassDictMixin):
+            values += _parse_pull_spring_settings(data)
+            names, current = _UPDATE_FIELDS_WITH_SETTINGS, _get_with_settings(self)
+        else:
+            names, current = _UPDATE_FIELDS, _get_update_fields(self)
+        # Most syncs change nothing; compare all fields at once first.
+        if values == current:
+            return {}
+        return self.update_fields(dict(zip(names, values)))
+
+    def update_fields(self, values: Mapping[str, Any]) -> FieldChanges:
+        """Set the given fields and return those whose value changed."""
+        changes: FieldChanges = {}
+        for name, new in values.items():
+            old = getattr(self, name)
+            if old != new:
+                setattr(self, name, new)
+                changes[name] = (old, new)
+        return changes
+
+
+@dataclass(slots=True)
+class TedeeLockChange:
+    """Changes applied to a single lock by a sync or webhook."""
+
+    lock_id: int
+    changes: FieldChanges
+
+
+@dataclass(slots=True)
+class TedeeBridge:
     """Tedee Bridge."""
 
     id: int
     serial: str
     name: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the bridge as a dict of plain values."""
+        return {"id": self.id, "serial": self.serial, "name": self.name}
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> TedeeBridge:
+        """Create a bridge from a dict made by :meth:`to_dict`.
+
+        Raises:
+            KeyError: If a field is missing.
+        """
+        return cls(id=d["id"], serial=d["serial"], name=d["name"])
+
     @classmethod
     def from_api_response(cls, data: dict) -> TedeeBridge:
         """Create a TedeeBridge from an API response dict."""
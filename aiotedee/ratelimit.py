@@ -0,0 +1,75 @@
+"""Per-host rate limiting for aiotedee."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+
+from .const import (
+    API_HOST,
+    CLOUD_RATE_LIMIT,
+    CLOUD_RATE_LIMIT_BURST,
+    RATE_LIMIT,
+    RATE_LIMIT_BURST,
+)
+
+
+class TokenBucket:
+    """Token bucket allowing *rate* requests per second in bursts of *burst*."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it.
+
+        Tokens may be taken ahead of time, in which case the balance goes
+        negative and later callers queue up behind earlier ones.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keeping a separate budget per host.
+
+    Requests only wait when a host's budget is exhausted.  *host_limits*
+    overrides ``(rate, burst)`` for specific hosts, e.g. the cloud API.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT,
+        burst: float = RATE_LIMIT_BURST,
+        host_limits: Mapping[str, tuple[float, float]] | None = None,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._host_limits = dict(host_limits or {})
+        self._buckets: dict[str, TokenBucket] = {}
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to *host* is within budget."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self._host_limits.get(host, (self._rate, self._burst))
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        delay = bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+DEFAULT_RATE_LIMITER = RateLimiter(
+    host_limits={API_HOST: (CLOUD_RATE_LIMIT, CLOUD_RATE_LIMIT_BURST)}
+)
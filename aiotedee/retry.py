@@ -0,0 +1,83 @@
+"""Retry policies for local API calls."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from .const import NUM_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY
+from .exceptions import (
+    TedeeAuthException,
+    TedeeClientException,
+    TedeeConflictException,
+    TedeeNotFoundException,
+    TedeeRateLimitException,
+    TedeeTimeoutException,
+)
+
+DEFAULT_RETRY_ON: Mapping[type[Exception], bool] = MappingProxyType(
+    {
+        TedeeAuthException: False,
+        TedeeNotFoundException: False,
+        TedeeConflictException: True,
+        TedeeTimeoutException: True,
+        TedeeRateLimitException: True,
+        TedeeClientException: True,
+    }
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Decide whether and when a failed request is retried.
+
+    Delays grow exponentially from *base_delay* by *multiplier* up to
+    *max_delay*.  With *jitter* enabled a random delay between zero and that
+    value is used ("full jitter"), so clients that failed together do not
+    retry in lockstep.  *retry_on* maps exception classes to whether they are
+    retried and is merged over :data:`DEFAULT_RETRY_ON`, so only the classes
+    to change need to be given; the most specific class in the exception's
+    MRO wins and exceptions not covered are not retried.
+    """
+
+    max_attempts: int = NUM_RETRIES
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    multiplier: float = 2.0
+    jitter: bool = True
+    max_elapsed: float | None = None
+    retry_on: Mapping[type[Exception], bool] = field(
+        default_factory=lambda: DEFAULT_RETRY_ON, hash=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.retry_on is not DEFAULT_RETRY_ON:
+            object.__setattr__(
+                self,
+                "retry_on",
+                MappingProxyType({**DEFAULT_RETRY_ON, **self.retry_on}),
+            )
+
+    def should_retry(self, ex: Exception) -> bool:
+        """Return whether *ex* is worth retrying at all."""
+        for cls in type(ex).__mro__:
+            if cls in self.retry_on:
+                return self.retry_on[cls]
+        return False
+
+    def next_delay(self, ex: Exception, attempt: int, elapsed: float) -> float | None:
+        """Return the delay before the next attempt, or None to give up.
+
+        *attempt* is the number of the attempt that just failed and *elapsed*
+        the seconds spent since the first attempt started.
+        """
+        if attempt >= self.max_attempts or not self.should_retry(ex):
+            return None
+        delay = min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
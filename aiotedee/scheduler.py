@@ -0,0 +1,152 @@
+"""Priority scheduling of cloud API requests with rate-limit backoff."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+from typing import TypeVar
+from weakref import WeakValueDictionary
+
+from .const import (
+    CLOUD_MAX_CONCURRENT_REQUESTS,
+    NUM_RETRIES,
+    RATE_LIMIT_BACKOFF,
+    RATE_LIMIT_MAX_BACKOFF,
+)
+from .exceptions import TedeeRateLimitException
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class RequestPriority(IntEnum):
+    """Priority lanes of the request scheduler, lowest value first."""
+
+    LOCK_OPERATION = 0
+    POLL = 1
+    BACKGROUND = 2
+
+
+class RequestScheduler:
+    """Queue requests by priority and back off when rate limited.
+
+    At most *max_concurrency* requests run at once; waiting requests are
+    started in priority order, first come first served within a lane.  When a
+    request is answered with HTTP 429 the whole scheduler pauses for the
+    ``Retry-After`` duration (or an exponential backoff if the header is
+    missing) and the request is queued again, up to *max_retries* attempts.
+    """
+
+    _by_key: WeakValueDictionary[str, RequestScheduler] = WeakValueDictionary()
+
+    def __init__(
+        self,
+        max_concurrency: int = CLOUD_MAX_CONCURRENT_REQUESTS,
+        max_retries: int = NUM_RETRIES,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._active = 0
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._blocked_until = 0.0
+        self._backoff_count = 0
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @classmethod
+    def for_key(cls, key: str) -> RequestScheduler:
+        """Return the scheduler shared by all clients using *key*."""
+        scheduler = cls._by_key.get(key)
+        if scheduler is None:
+            scheduler = cls._by_key[key] = cls()
+        return scheduler
+
+    async def run(
+        self,
+        priority: RequestPriority,
+        request: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Run *request* once it is its turn, retrying on rate limits."""
+        seq = next(self._counter)
+        attempt = 1
+        while True:
+            await self._acquire(priority, seq)
+            try:
+                result = await request()
+            except TedeeRateLimitException as ex:
+                self._back_off(ex.retry_after)
+                if attempt >= self._max_retries:
+                    raise
+                _LOGGER.debug(
+                    "Rate limited, retrying %s request (attempt %s)",
+                    priority.name,
+                    attempt,
+                )
+            else:
+                self._backoff_count = 0
+                return result
+            finally:
+                self._release()
+            attempt += 1
+
+    # -- Internal helpers ------------------------------------------------------
+
+    async def _acquire(self, priority: RequestPriority, seq: int) -> None:
+        """Wait for a free slot."""
+        if (
+            self._active < self._max_concurrency
+            and not self._queue
+            and time.monotonic() >= self._blocked_until
+        ):
+            self._active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, seq, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Free a slot and hand it to the next queued request."""
+        self._active -= 1
+        self._dispatch()
+
+    def _back_off(self, retry_after: float | None) -> None:
+        """Pause the scheduler after a rate-limited response."""
+        if retry_after is None:
+            retry_after = min(
+                RATE_LIMIT_BACKOFF * 2**self._backoff_count, RATE_LIMIT_MAX_BACKOFF
+            )
+        self._backoff_count += 1
+        _LOGGER.debug("Rate limited, pausing requests for %ss", retry_after)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def _dispatch(self) -> None:
+        """Start queued requests while slots are free and not backing off."""
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            if self._wakeup is None:
+                self._wakeup = asyncio.get_running_loop().call_later(
+                    delay, self._on_wakeup
+                )
+            return
+        while self._queue and self._active < self._max_concurrency:
+            _, _, future = heapq.heappop(self._queue)
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._dispatch()
@@ -0,0 +1,217 @@
+"""Webhook receiver server for bridge callbacks."""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import ipaddress
+import logging
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+from aiohttp import web
+
+from .client.base import TedeeClientBase
+from .client.local import TedeeLocalClient
+from .const import (
+    WEBHOOK_QUEUE_SIZE,
+    WEBHOOK_SECRET_HEADER,
+    WEBHOOK_SERVER_PATH,
+    WEBHOOK_SERVER_PORT,
+    WEBHOOK_WORKERS,
+)
+from .exceptions import TedeeWebhookException
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TedeeWebhookServer:
+    """Receive webhook callbacks from many bridges and route them to clients.
+
+    Every bridge posts to ``{path}/{bridge}``, where *bridge* is the key its
+    client was registered under.  Requests are answered right away and the
+    messages are handed to worker tasks through a bounded queue; when the
+    queue is full the server answers ``503`` instead of buffering without
+    limit.  Messages that piled up in the queue are processed as a batch per
+    client, so bursts after a reconnect are coalesced per lock.
+
+    The server listens on the loopback interface unless another *host* is
+    given.  With a *secret* set, callbacks must carry it in the
+    *secret_header* header or are answered with ``401``;
+    :meth:`register_webhook` makes the bridge send that header.
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[Hashable, TedeeClientBase] | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = WEBHOOK_SERVER_PORT,
+        path: str = WEBHOOK_SERVER_PATH,
+        secret: str | None = None,
+        secret_header: str = WEBHOOK_SECRET_HEADER,
+        max_queue_size: int = WEBHOOK_QUEUE_SIZE,
+        workers: int = WEBHOOK_WORKERS,
+    ) -> None:
+        self._clients: dict[str, TedeeClientBase] = {
+            str(bridge): client for bridge, client in (clients or {}).items()
+        }
+        self._host = host
+        self._port = port
+        self._path = path.rstrip("/")
+        self._secret = secret
+        self._secret_header = secret_header
+        self._max_queue_size = max_queue_size
+        self._num_workers = workers
+        self._queue: asyncio.Queue[tuple[TedeeClientBase, Any]] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._runner: web.AppRunner | None = None
+
+        self._app = web.Application()
+        self._app.router.add_post(f"{self._path}/{{bridge}}", self._handle_callback)
+        self._app.on_startup.append(self._start_workers)
+        self._app.on_cleanup.append(self._stop_workers)
+
+    # -- Public properties -----------------------------------------------------
+
+    @property
+    def app(self) -> web.Application:
+        """Return the aiohttp application, e.g. to mount it elsewhere."""
+        return self._app
+
+    # -- Client registry -------------------------------------------------------
+
+    def add_client(self, bridge: Hashable, client: TedeeClientBase) -> None:
+        """Route callbacks for *bridge* to *client*."""
+        self._clients[str(bridge)] = client
+
+    def remove_client(self, bridge: Hashable) -> TedeeClientBase:
+        """Stop routing callbacks for *bridge* and return its client."""
+        return self._clients.pop(str(bridge))
+
+    def url_for(self, bridge: Hashable, host: str) -> str:
+        """Return the callback URL for *bridge*, reachable under *host*."""
+        return f"http://{host}:{self._port}{self._path}/{bridge}"
+
+    async def register_webhook(
+        self,
+        bridge: Hashable,
+        host: str,
+        headers_bridge_sends: list | None = None,
+    ) -> int:
+        """Register this server as webhook on the bridge's local client.
+
+        Raises:
+            TedeeWebhookException: If the client is not a local client, or
+                the server only listens on loopback while *host* is not a
+                loopback address, so the bridge could never reach it.
+        """
+        client = self._clients[str(bridge)]
+        if not isinstance(client, TedeeLocalClient):
+            raise TedeeWebhookException(
+                "Webhooks can only be registered on local clients"
+            )
+        if _is_loopback(self._host) and not _is_loopback(host):
+            raise TedeeWebhookException(
+                f"Server listens on {self._host}, unreachable for the bridge "
+                f"at {host}; pass a host to listen on"
+            )
+        headers = list(headers_bridge_sends or [])
+        if self._secret is not None:
+            headers.append({self._secret_header: self._secret})
+        return await client.register_webhook(self.url_for(bridge, host), headers)
+
+    # -- Lifecycle -------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start listening for callbacks."""
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        _LOGGER.debug("Webhook server listening on %s:%s", self._host, self._port)
+
+    async def stop(self) -> None:
+        """Stop the server and its workers."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def join(self) -> None:
+        """Wait until all queued messages have been processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def __aenter__(self) -> TedeeWebhookServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.stop()
+
+    # -- Internal helpers ------------------------------------------------------
+
+    async def _handle_callback(self, request: web.Request) -> web.Response:
+        """Acknowledge a callback and queue it for processing."""
+        client = self._clients.get(request.match_info["bridge"])
+        if client is None:
+            return web.Response(status=404)
+        if self._secret is not None and not hmac.compare_digest(
+            request.headers.get(self._secret_header, ""), self._secret
+        ):
+            return web.Response(status=401)
+        if self._queue is None:
+            return web.Response(status=503)
+        try:
+            message = client.decode_webhook(await request.read())
+        except TedeeWebhookException:
+            return web.Response(status=400)
+        try:
+            self._queue.put_nowait((client, message))
+        except asyncio.QueueFull:
+            _LOGGER.debug("Webhook queue full, rejecting callback")
+            return web.Response(status=503)
+        return web.Response(status=204)
+
+    async def _worker(self) -> None:
+        """Process queued messages, batching whatever has piled up."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            batches: dict[TedeeClientBase, list[Any]] = {}
+            client, message = await queue.get()
+            batches[client] = [message]
+            while not queue.empty():
+                client, message = queue.get_nowait()
+                batches.setdefault(client, []).append(message)
+            for client, messages in batches.items():
+                try:
+                    client.parse_webhook_messages(messages)
+                except Exception:  # noqa: BLE001 - keep the worker alive
+                    _LOGGER.exception("Error processing webhook messages")
+                finally:
+                    for _ in messages:
+                        queue.task_done()
+
+    async def _start_workers(self, _app: web.Application) -> None:
+        self._queue = asyncio.Queue(self._max_queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._num_workers)
+        ]
+
+    async def _stop_workers(self, _app: web.Application) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+
+def _is_loopback(host: str) -> bool:
+    """Return whether *host* is a loopback address."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
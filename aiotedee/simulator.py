@@ -0,0 +1,371 @@
+"""Simulated local Tedee bridge for load and integration tests."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import random
+import time
+from collections import Counter
+from email.utils import formatdate
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, web
+
+from .codec import json_dumps, json_loads
+from .const import (
+    API_LOCAL_VERSION,
+    SIMULATOR_OPERATION_TIME,
+    SIMULATOR_TOKEN_MAX_AGE,
+    TIMEOUT,
+)
+from .models import TedeeDeviceType, TedeeDoorState, TedeeLock, TedeeLockState
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATUS_FIELDS = frozenset({"state", "state_change_result", "door_state"})
+# Unlock mode that also pulls the latch, as sent by ``open()``.
+_UNLOCK_MODE_PULL = "4"
+
+
+class TedeeBridgeSimulator:
+    """Serve the local bridge API for a configurable number of fake locks.
+
+    Requests are delayed by *latency* seconds and fail with ``500`` at the
+    given *error_rate*.  The ``api_token`` header is validated like on the
+    device: either the plain token, or ``sha256(token + ms) + ms`` with a
+    timestamp at most *token_max_age* seconds away from the bridge clock,
+    which runs *clock_offset* seconds ahead of the host clock.
+
+    Lock operations move a lock through its intermediate state to the final
+    one over *operation_time* seconds; ``unlock?mode=4`` and ``pull`` pass
+    through PULLING and PULLED.  Every state change is posted to the
+    registered callbacks, like the webhooks of the real bridge.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str = "",
+        num_locks: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0,
+        error_rate: float = 0,
+        operation_time: float = SIMULATOR_OPERATION_TIME,
+        api_token_mode_plain: bool = False,
+        token_max_age: float = SIMULATOR_TOKEN_MAX_AGE,
+        clock_offset: float = 0,
+        bridge_id: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        self._token = token
+        self._host = host
+        self._port = port
+        self._latency = latency
+        self._error_rate = error_rate
+        self._operation_time = operation_time
+        self._api_token_mode_plain = api_token_mode_plain
+        self._token_max_age = token_max_age
+        self._clock_offset = clock_offset
+        self._bridge_id = bridge_id
+        self._random = random.Random(seed)
+        self._locks: dict[int, TedeeLock] = {
+            lock_id: TedeeLock(
+                name=f"Lock {lock_id}",
+                id=lock_id,
+                type=TedeeDeviceType.LOCK_PRO,
+                state=TedeeLockState.LOCKED,
+                battery_level=100,
+                is_connected=True,
+                door_state=TedeeDoorState.CLOSED,
+                connected_to_id=bridge_id,
+            )
+            for lock_id in range(1, num_locks + 1)
+        }
+        self._callbacks: dict[int, dict[str, Any]] = {}
+        self._next_callback_id = 1
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._session: ClientSession | None = None
+        self._runner: web.AppRunner | None = None
+        self.requests: Counter[str] = Counter()
+
+        self._app = web.Application(middlewares=[self._middleware])
+        base = f"/{API_LOCAL_VERSION}"
+        self._app.router.add_get(f"{base}/bridge", self._get_bridge)
+        self._app.router.add_get(f"{base}/lock", self._get_locks)
+        self._app.router.add_get(f"{base}/lock/{{lock_id:\\d+}}", self._get_lock)
+        self._app.router.add_post(
+            f"{base}/lock/{{lock_id:\\d+}}/{{action:unlock|lock|pull}}",
+            self._operate,
+        )
+        self._app.router.add_get(f"{base}/callback", self._get_callbacks)
+        self._app.router.add_post(f"{base}/callback", self._add_callback)
+        self._app.router.add_put(f"{base}/callback", self._replace_callbacks)
+        self._app.router.add_delete(
+            f"{base}/callback/{{callback_id:\\d+}}", self._delete_callback
+        )
+
+    # -- Public properties -----------------------------------------------------
+
+    @property
+    def app(self) -> web.Application:
+        """Return the aiohttp application, e.g. for aiohttp test servers."""
+        return self._app
+
+    @property
+    def port(self) -> int:
+        """Return the port the simulator listens on."""
+        return self._port
+
+    @property
+    def locks(self) -> dict[int, TedeeLock]:
+        """Return the simulated locks keyed by ID."""
+        return self._locks
+
+    @property
+    def callbacks(self) -> list[dict[str, Any]]:
+        """Return the registered callbacks."""
+        return list(self._callbacks.values())
+
+    # -- Lock state ------------------------------------------------------------
+
+    def update_lock(self, lock_id: int, **values: Any) -> None:
+        """Change fields of a lock, notifying callbacks of the changes."""
+        lock = self._locks[lock_id]
+        changes = lock.update_fields(values)
+        if changes.keys() & _STATUS_FIELDS:
+            self._notify(
+                "lock-status-changed",
+                lock,
+                {
+                    "state": int(lock.state),
+                    "jammed": lock.state_change_result,
+                    "doorState": int(lock.door_state),
+                },
+            )
+        if "battery_level" in changes:
+            self._notify(
+                "device-battery-level-changed",
+                lock,
+                {"batteryLevel": lock.battery_level},
+            )
+        if "is_charging" in changes:
+            event = (
+                "device-battery-start-charging"
+                if lock.is_charging
+                else "device-battery-stop-charging"
+            )
+            self._notify(event, lock, {})
+        if "is_connected" in changes:
+            self._notify(
+                "device-connection-changed",
+                lock,
+                {"isConnected": int(lock.is_connected)},
+            )
+
+    # -- Lifecycle -------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start serving the bridge API."""
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+        _LOGGER.debug("Bridge simulator listening on %s:%s", self._host, self._port)
+
+    async def stop(self) -> None:
+        """Stop serving, cancel pending operations and callbacks."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> TedeeBridgeSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.stop()
+
+    # -- Request handling ------------------------------------------------------
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        """Apply latency, error injection and authentication to requests."""
+        self.requests[f"{request.method} {request.path}"] += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        if self._error_rate and self._random.random() < self._error_rate:
+            response: web.StreamResponse = web.Response(status=500)
+        elif not self._is_authorized(request.headers.get("api_token", "")):
+            response = web.Response(status=401)
+        else:
+            response = await handler(request)
+        if self._clock_offset:
+            response.headers["Date"] = formatdate(self._now(), usegmt=True)
+        return response
+
+    def _is_authorized(self, api_token: str) -> bool:
+        if self._api_token_mode_plain:
+            return hmac.compare_digest(api_token, self._token)
+        digest, timestamp = api_token[:64], api_token[64:]
+        if not timestamp.isdigit():
+            return False
+        if abs(int(timestamp) / 1000 - self._now()) > self._token_max_age:
+            return False
+        expected = hashlib.sha256(f"{self._token}{timestamp}".encode()).hexdigest()
+        return hmac.compare_digest(digest, expected)
+
+    async def _get_bridge(self, _request: web.Request) -> web.Response:
+        return self._json(
+            {
+                "id": self._bridge_id,
+                "serialNumber": f"SIM-{self._bridge_id:08d}",
+                "name": f"Simulated Bridge {self._bridge_id}",
+            }
+        )
+
+    async def _get_locks(self, _request: web.Request) -> web.Response:
+        return self._json([_lock_json(lock) for lock in self._locks.values()])
+
+    async def _get_lock(self, request: web.Request) -> web.Response:
+        lock = self._locks.get(int(request.match_info["lock_id"]))
+        if lock is None:
+            return web.Response(status=404)
+        return self._json(_lock_json(lock))
+
+    async def _operate(self, request: web.Request) -> web.Response:
+        lock_id = int(request.match_info["lock_id"])
+        if lock_id not in self._locks:
+            return web.Response(status=404)
+        action = request.match_info["action"]
+        if action == "lock":
+            steps: tuple[TedeeLockState, ...] = (
+                TedeeLockState.LOCKING,
+                TedeeLockState.LOCKED,
+            )
+        elif action == "unlock" and request.query.get("mode") != _UNLOCK_MODE_PULL:
+            steps = (TedeeLockState.UNLOCKING, TedeeLockState.UNLOCKED)
+        else:
+            steps = (
+                TedeeLockState.PULLING,
+                TedeeLockState.PULLED,
+                TedeeLockState.UNLOCKED,
+            )
+        self._spawn(self._run_operation(lock_id, steps))
+        return web.Response(status=202)
+
+    async def _get_callbacks(self, _request: web.Request) -> web.Response:
+        return self._json(self.callbacks)
+
+    async def _add_callback(self, request: web.Request) -> web.Response:
+        callback = self._store_callback(json_loads(await request.read()))
+        return self._json({"id": callback["id"]})
+
+    async def _replace_callbacks(self, request: web.Request) -> web.Response:
+        self._callbacks.clear()
+        for callback in json_loads(await request.read()):
+            self._store_callback(callback)
+        return web.Response(status=204)
+
+    async def _delete_callback(self, request: web.Request) -> web.Response:
+        if self._callbacks.pop(int(request.match_info["callback_id"]), None) is None:
+            return web.Response(status=404)
+        return web.Response(status=204)
+
+    # -- Internal helpers ------------------------------------------------------
+
+    def _now(self) -> float:
+        """Return the bridge clock in seconds since the epoch."""
+        return time.time() + self._clock_offset
+
+    @staticmethod
+    def _json(data: Any) -> web.Response:
+        return web.Response(body=json_dumps(data), content_type="application/json")
+
+    def _store_callback(self, data: dict[str, Any]) -> dict[str, Any]:
+        callback = {
+            "id": self._next_callback_id,
+            "url": data["url"],
+            "method": data.get("method", "POST"),
+            "headers": data.get("headers", []),
+        }
+        self._callbacks[callback["id"]] = callback
+        self._next_callback_id += 1
+        return callback
+
+    async def _run_operation(
+        self, lock_id: int, steps: tuple[TedeeLockState, ...]
+    ) -> None:
+        delay = self._operation_time / len(steps)
+        for state in steps:
+            self.update_lock(lock_id, state=state)
+            if state is not steps[-1]:
+                await asyncio.sleep(delay)
+
+    def _notify(self, event: str, lock: TedeeLock, data: dict[str, Any]) -> None:
+        if not self._callbacks:
+            return
+        message = json_dumps(
+            {
+                "event": event,
+                "timestamp": formatdate(self._now(), usegmt=True),
+                "data": {"deviceId": lock.id, **data},
+            }
+        )
+        for callback in self._callbacks.values():
+            self._spawn(self._deliver(callback, message))
+
+    async def _deliver(self, callback: dict[str, Any], message: bytes) -> None:
+        """Post *message* to *callback*, ignoring unreachable receivers."""
+        if self._session is None:
+            self._session = ClientSession(timeout=ClientTimeout(total=TIMEOUT))
+        headers = {"Content-Type": "application/json"}
+        for header in callback["headers"]:
+            headers.update(header)
+        try:
+            async with self._session.request(
+                callback["method"], callback["url"], data=message, headers=headers
+            ) as response:
+                self.requests[f"callback {response.status}"] += 1
+        except (ClientError, TimeoutError) as ex:
+            _LOGGER.debug("Callback to %s failed: %s", callback["url"], ex)
+            self.requests["callback failed"] += 1
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def _lock_json(lock: TedeeLock) -> dict[str, Any]:
+    """Return *lock* in the format of the local API."""
+    return {
+        "id": lock.id,
+        "name": lock.name,
+        "type": int(lock.type),
+        "isConnected": int(lock.is_connected),
+        "connectedToId": lock.connected_to_id,
+        "state": int(lock.state),
+        "batteryLevel": lock.battery_level,
+        "isCharging": int(lock.is_charging),
+        "jammed": lock.state_change_result,
+        "doorState": int(lock.door_state),
+        "deviceSettings": {
+            "pullSpringEnabled": int(lock.is_enabled_pullspring),
+            "autoPullSpringEnabled": int(lock.is_enabled_auto_pullspring),
+            "pullSpringDuration": lock.duration_pullspring,
+        },
+    }
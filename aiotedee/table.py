@@ -0,0 +1,162 @@
+"""Columnar lock state storage for fleet-wide queries."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Callable, Hashable, Iterable
+
+from .models import TedeeDoorState, TedeeLock, TedeeLockState
+
+_NO_VALUE = 255
+_MATCH = re.compile(b"\x01")
+
+# A lock ID, or ``(key, lock_id)`` for rows upserted with a key.
+LockKey = int | tuple[Hashable, int]
+
+
+def _byte(value: int | None) -> int:
+    """Clamp a column value into a byte, mapping None to ``_NO_VALUE``."""
+    if value is None:
+        return _NO_VALUE
+    return min(max(int(value), 0), _NO_VALUE)
+
+
+def _mask_table(predicate: Callable[[int], bool]) -> bytes:
+    """Return a translation table mapping matching byte values to 1."""
+    return bytes(1 if predicate(value) else 0 for value in range(256))
+
+
+_IS_ONE = _mask_table(lambda value: value == 1)
+_IS_ZERO = _mask_table(lambda value: value == 0)
+
+
+class LockStateTable:
+    """Array-backed store keeping one column per lock state field.
+
+    Rows are kept dense, so queries translate a whole column into a 0/1 mask
+    and scan it for matches in C instead of looping over :class:`TedeeLock`
+    objects.  Only the matching rows are touched in Python.
+
+    Rows are identified by the lock ID.  Tables shared by several clients,
+    whose lock IDs may overlap, upsert with a *key* per client; those rows
+    are identified and returned by queries as ``(key, lock_id)``.
+    """
+
+    def __init__(self, locks: Iterable[TedeeLock] = ()) -> None:
+        self._rows: dict[LockKey, int] = {}
+        self._ids: list[LockKey] = []
+        self._bridges = array("q")
+        self._state = bytearray()
+        self._battery_level = bytearray()
+        self._door_state = bytearray()
+        self._is_connected = bytearray()
+        self._state_change_result = bytearray()
+        for lock in locks:
+            self.upsert(lock)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, lock_key: object) -> bool:
+        return lock_key in self._rows
+
+    # -- Maintenance -----------------------------------------------------------
+
+    def upsert(self, lock: TedeeLock, key: Hashable | None = None) -> None:
+        """Insert or update the row of *lock*, owned by *key* if given."""
+        lock_key = lock.id if key is None else (key, lock.id)
+        bridge = -1 if lock.connected_to_id is None else lock.connected_to_id
+        values = (
+            _byte(lock.state),
+            _byte(lock.battery_level),
+            _byte(lock.door_state),
+            int(lock.is_connected),
+            _byte(lock.state_change_result),
+        )
+        row = self._rows.get(lock_key)
+        if row is None:
+            self._rows[lock_key] = len(self._ids)
+            self._ids.append(lock_key)
+            self._bridges.append(bridge)
+            for column, value in zip(self._columns, values):
+                column.append(value)
+            return
+        self._bridges[row] = bridge
+        for column, value in zip(self._columns, values):
+            column[row] = value
+
+    def remove(self, lock_id: int, key: Hashable | None = None) -> None:
+        """Remove the row of *lock_id*, moving the last row into its place."""
+        row = self._rows.pop(lock_id if key is None else (key, lock_id), None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            self._rows[self._ids[last]] = row
+            self._ids[row] = self._ids[last]
+            self._bridges[row] = self._bridges[last]
+            for column in self._columns:
+                column[row] = column[last]
+        self._ids.pop()
+        self._bridges.pop()
+        for column in self._columns:
+            column.pop()
+
+    # -- Queries ---------------------------------------------------------------
+
+    def with_state(self, state: TedeeLockState) -> list[LockKey]:
+        """Return the IDs of locks in *state*."""
+        return self._where(self._state, _mask_table(lambda value: value == state))
+
+    def with_door_state(self, door_state: TedeeDoorState) -> list[LockKey]:
+        """Return the IDs of locks whose door is in *door_state*."""
+        return self._where(
+            self._door_state, _mask_table(lambda value: value == door_state)
+        )
+
+    def jammed(self) -> list[LockKey]:
+        """Return the IDs of jammed locks."""
+        return self._where(self._state_change_result, _IS_ONE)
+
+    def battery_below(self, threshold: int) -> list[LockKey]:
+        """Return the IDs of locks with a known battery level below *threshold*."""
+        return self._where(
+            self._battery_level,
+            _mask_table(lambda value: value < threshold and value != _NO_VALUE),
+        )
+
+    def disconnected(self) -> list[LockKey]:
+        """Return the IDs of disconnected locks."""
+        return self._where(self._is_connected, _IS_ZERO)
+
+    def disconnected_per_bridge(self) -> dict[int | None, list[LockKey]]:
+        """Return the IDs of disconnected locks grouped by bridge ID."""
+        result: dict[int | None, list[LockKey]] = {}
+        for row in self._match(self._is_connected, _IS_ZERO):
+            bridge = self._bridges[row]
+            result.setdefault(None if bridge == -1 else bridge, []).append(
+                self._ids[row]
+            )
+        return result
+
+    # -- Internal helpers ------------------------------------------------------
+
+    @property
+    def _columns(self) -> tuple[bytearray, ...]:
+        return (
+            self._state,
+            self._battery_level,
+            self._door_state,
+            self._is_connected,
+            self._state_change_result,
+        )
+
+    def _where(self, column: bytearray, table: bytes) -> list[LockKey]:
+        ids = self._ids
+        return [ids[row] for row in self._match(column, table)]
+
+    @staticmethod
+    def _match(column: bytearray, table: bytes) -> list[int]:
+        """Return the rows of *column* whose value maps to 1 in *table*."""
+        return [match.start() for match in _MATCH.finditer(column.translate(table))]
@@ -5,44 +5,49 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from .models import (
+    FieldChanges,
     TedeeLock,
+    TedeeLockState,
     _safe_door_state,
     _safe_lock_state,
 )
 
 
-def _handle_connection_changed(lock: TedeeLock, data: dict) -> None:
-    lock.is_connected = data.get("isConnected", 0) == 1
+def _handle_connection_changed(lock: TedeeLock, data: dict) -> FieldChanges:
+    return lock.update_fields({"is_connected": data.get("isConnected", 0) == 1})
 
 
-def _handle_lock_status_changed(lock: TedeeLock, data: dict) -> None:
-    lock.state = _safe_lock_state(data.get("state", 0))
-    lock.state_change_result = data.get("jammed", 0)
-    lock.door_state = _safe_door_state(data.get("doorState", 0))
+def _handle_lock_status_changed(lock: TedeeLock, data: dict) -> FieldChanges:
+    return lock.update_fields(
+        {
+            "state": _safe_lock_state(data.get("state", 0)),
+            "state_change_result": data.get("jammed", 0),
+            "door_state": _safe_door_state(data.get("doorState", 0)),
+        }
+    )
 
 
-def _handle_battery_level_changed(lock: TedeeLock, data: dict) -> None:
-    lock.battery_level = data.get("batteryLevel")
+def _handle_battery_level_changed(lock: TedeeLock, data: dict) -> FieldChanges:
+    return lock.update_fields({"battery_level": data.get("batteryLevel")})
 
 
-def _handle_battery_start_charging(lock: TedeeLock, _data: dict) -> None:
-    lock.is_charging = True
+def _handle_battery_start_charging(lock: TedeeLock, _data: dict) -> FieldChanges:
+    return lock.update_fields({"is_charging": True})
 
 
-def _handle_battery_stop_charging(lock: TedeeLock, _data: dict) -> None:
-    lock.is_charging = False
+def _handle_battery_stop_charging(lock: TedeeLock, _data: dict) -> FieldChanges:
+    return lock.update_fields({"is_charging": False})
 
 
-def _handle_battery_fully_charged(lock: TedeeLock, _data: dict) -> None:
-    lock.is_charging = False
-    lock.battery_level = 100
+def _handle_battery_fully_charged(lock: TedeeLock, _data: dict) -> FieldChanges:
+    return lock.update_fields({"is_charging": False, "battery_level": 100})
 
 
-def _noop(_lock: TedeeLock, _data: dict) -> None:
-    pass
+def _noop(_lock: TedeeLock, _data: dict) -> FieldChanges:
+    return {}
 
 
-WebhookHandler = Callable[[TedeeLock, dict[str, Any]], None]
+WebhookHandler = Callable[[TedeeLock, dict[str, Any]], FieldChanges]
 
 WEBHOOK_HANDLERS: dict[str, WebhookHandler] = {
     "device-connection-changed": _handle_connection_changed,
@@ -53,3 +58,10 @@ WEBHOOK_HANDLERS: dict[str, WebhookHandler] = {
     "device-battery-fully-charged": _handle_battery_fully_charged,
     "device-settings-changed": _noop,
 }
+
+
+def webhook_lock_state(handler: WebhookHandler, data: dict) -> TedeeLockState | None:
+    """Return the lock state reported by a message for *handler*, if any."""
+    if handler is _handle_lock_status_changed:
+        return _safe_lock_state(data.get("state", 0))
+    return None
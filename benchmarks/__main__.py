@@ -0,0 +1,69 @@
+"""Run the benchmark suite.
+
+Run with ``python -m benchmarks``.  Results are written as JSON with
+``--output``; ``--baseline`` compares them to an earlier run and exits
+non-zero if any benchmark got slower by more than ``--threshold``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from . import suite  # noqa: F401 - registers the benchmarks
+from .runner import BENCHMARKS, Runner, compare, load_results, save_results
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="BENCHMARK",
+        help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})",
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write results to FILE")
+    parser.add_argument("-b", "--baseline", type=Path, help="compare to FILE")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="slowdown treated as a regression (default: %(default)s = 20%%)",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per benchmark")
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="minimum seconds per round"
+    )
+    args = parser.parse_args()
+    if unknown := set(args.benchmarks) - BENCHMARKS.keys():
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    return args
+
+
+async def _run(names: list[str], runner: Runner) -> None:
+    for name in names:
+        await BENCHMARKS[name](runner)
+
+
+def main() -> int:
+    args = _parse_args()
+    runner = Runner(rounds=args.rounds, min_time=args.min_time)
+    asyncio.run(_run(args.benchmarks or list(BENCHMARKS), runner))
+
+    if args.output:
+        save_results(args.output, runner.results)
+    if args.baseline:
+        regressions = compare(
+            runner.results, load_results(args.baseline), args.threshold
+        )
+        if regressions:
+            print(f"\n{len(regressions)} regressed: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Synthetic lock payloads shaped like the local and cloud API responses."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def local_payload(num_locks: int) -> list[dict[str, Any]]:
+    """Return a local API ``/lock`` payload of *num_locks* locks."""
+    return [
+        {
+            "id": i,
+            "name": f"Lock {i}",
+            "type": 2 + 2 * (i % 2),
+            "isConnected": i % 10 != 0,
+            "connectedToId": i // 100,
+            "state": (2, 6, 9, 42)[i % 4],
+            "batteryLevel": i % 101,
+            "isCharging": False,
+            "jammed": int(i % 50 == 0),
+            "doorState": i % 5,
+            "deviceSettings": {
+                "pullSpringEnabled": True,
+                "autoPullSpringEnabled": False,
+                "pullSpringDuration": 7,
+            },
+        }
+        for i in range(num_locks)
+    ]
+
+
+def cloud_payload(num_locks: int) -> list[dict[str, Any]]:
+    """Return a cloud API sync payload of *num_locks* locks."""
+    return [
+        {
+            "id": lock["id"],
+            "name": lock["name"],
+            "type": lock["type"],
+            "isConnected": lock["isConnected"],
+            "connectedToId": lock["connectedToId"],
+            "lockProperties": {
+                "state": lock["state"],
+                "batteryLevel": lock["batteryLevel"],
+                "isCharging": lock["isCharging"],
+                "stateChangeResult": lock["jammed"],
+                "doorState": lock["doorState"],
+            },
+            "deviceSettings": lock["deviceSettings"],
+        }
+        for lock in local_payload(num_locks)
+    ]
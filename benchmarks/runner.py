@@ -0,0 +1,153 @@
+"""Timing, storage and baseline comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import inspect
+import json
+import platform
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+Operation = Callable[[], "Awaitable[Any] | Any"]
+Benchmark = Callable[["Runner"], Awaitable[None]]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Register a benchmark of the suite under *name*."""
+
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+@dataclass
+class Result:
+    """Timing of a single measurement in seconds per operation."""
+
+    name: str
+    best: float
+    median: float
+    rounds: int
+    iterations: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1 / self.best
+
+
+class Runner:
+    """Time operations and collect the results.
+
+    Each operation is first calibrated to run for at least *min_time* seconds
+    per round, then timed for *rounds* rounds.  The best round is reported as
+    the primary value since it is the least disturbed by other processes.
+    """
+
+    def __init__(self, *, rounds: int = 5, min_time: float = 0.1) -> None:
+        self._rounds = rounds
+        self._min_time = min_time
+        self.results: list[Result] = []
+
+    async def __call__(self, name: str, operation: Operation) -> Result:
+        """Time *operation*, which may return an awaitable, under *name*."""
+        is_async = inspect.isawaitable(first := operation())
+        if is_async:
+            await first
+
+        iterations = 1
+        while (elapsed := await self._time(operation, iterations, is_async)) < (
+            self._min_time
+        ):
+            iterations *= max(2, min(10, int(self._min_time / max(elapsed, 1e-9))))
+
+        timings = sorted(
+            [elapsed / iterations]
+            + [
+                await self._time(operation, iterations, is_async) / iterations
+                for _ in range(self._rounds - 1)
+            ]
+        )
+        result = Result(
+            name=name,
+            best=timings[0],
+            median=timings[len(timings) // 2],
+            rounds=self._rounds,
+            iterations=iterations,
+        )
+        self.results.append(result)
+        print(
+            f"{name:<56}{_format_time(result.best):>12}"
+            f"{result.ops_per_sec:>14,.0f}/s"
+        )
+        return result
+
+    @staticmethod
+    async def _time(operation: Operation, iterations: int, is_async: bool) -> float:
+        start = time.perf_counter()
+        if is_async:
+            for _ in range(iterations):
+                await operation()
+        else:
+            for _ in range(iterations):
+                operation()
+        return time.perf_counter() - start
+
+
+def save_results(path: Path, results: list[Result]) -> None:
+    """Write *results* and details of the environment as JSON to *path*."""
+    data = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def load_results(path: Path) -> dict[str, float]:
+    """Return the best time per operation of each benchmark in *path*."""
+    data = json.loads(path.read_text())
+    return {name: result["best"] for name, result in data["results"].items()}
+
+
+def compare(
+    results: list[Result], baseline: dict[str, float], threshold: float
+) -> list[str]:
+    """Print *results* relative to *baseline* and return the regressions.
+
+    A benchmark regressed if it is more than *threshold* (a fraction) slower
+    than its baseline.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<56}{'baseline':>12}{'current':>12}{'change':>10}")
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            print(f"{result.name:<56}{'-':>12}{_format_time(result.best):>12}")
+            continue
+        change = result.best / base - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(result.name)
+            flag = "  REGRESSION"
+        print(
+            f"{result.name:<56}{_format_time(base):>12}"
+            f"{_format_time(result.best):>12}{change:>+10.1%}{flag}"
+        )
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
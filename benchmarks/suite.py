@@ -0,0 +1,283 @@
+"""Benchmarks of the library's hot paths.
+
+Each benchmark receives a :class:`Runner` and times one or more operations
+with it.  Network access is replaced by an in-process stub so results only
+depend on the library and the machine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from itertools import cycle
+from http import HTTPMethod
+from typing import Any
+
+from aiohttp import ClientSession, web
+
+from aiotedee import LockStateTable, RateLimiter, TedeeLock, TedeeLocalClient
+from aiotedee.client.base import TedeeClientBase
+from aiotedee.helpers import http_request
+
+from .payloads import cloud_payload, local_payload
+from .runner import Runner, benchmark
+
+SYNC_SIZES = (10, 1_000, 10_000)
+MODEL_LOCKS = 10_000
+MEMORY_LOCKS = 100_000
+
+# Statements timed in a fresh interpreter, next to a bare interpreter start.
+IMPORT_STATEMENTS = {
+    "interpreter": "pass",
+    "aiotedee": "import aiotedee",
+    "aiotedee.webhook": "import aiotedee.webhook",
+    "aiotedee.TedeeLocalClient": "import aiotedee; aiotedee.TedeeLocalClient",
+}
+
+WEBHOOK_EVENTS: dict[str, dict[str, Any]] = {
+    "device-connection-changed": {"isConnected": 1},
+    "lock-status-changed": {"state": 2, "jammed": 0, "doorState": 3},
+    "device-battery-level-changed": {"batteryLevel": 55},
+    "device-battery-start-charging": {},
+    "device-battery-stop-charging": {},
+    "device-battery-fully-charged": {},
+    "device-settings-changed": {},
+}
+
+# Pairs of events that undo each other, so every call changes the lock.
+WEBHOOK_CHANGES: dict[str, tuple[tuple[str, dict[str, Any]], ...]] = {
+    "lock-status": (
+        ("lock-status-changed", {"state": 2, "jammed": 0, "doorState": 2}),
+        ("lock-status-changed", {"state": 6, "jammed": 0, "doorState": 3}),
+    ),
+    "battery-level": (
+        ("device-battery-level-changed", {"batteryLevel": 55}),
+        ("device-battery-level-changed", {"batteryLevel": 56}),
+    ),
+    "connection": (
+        ("device-connection-changed", {"isConnected": 0}),
+        ("device-connection-changed", {"isConnected": 1}),
+    ),
+    "charging": (
+        ("device-battery-start-charging", {}),
+        ("device-battery-stop-charging", {}),
+    ),
+}
+
+_UNLIMITED = RateLimiter(rate=1e9, burst=1e9)
+
+
+class _StubClient(TedeeClientBase):
+    """Client serving alternating sync payloads without any network access."""
+
+    def __init__(self, payloads: list[list[dict]]) -> None:
+        super().__init__()
+        self._payloads = payloads
+        self._calls = 0
+
+    async def _fetch_locks(self) -> tuple[list[dict], bool]:
+        return self._payloads[0], True
+
+    async def _fetch_sync(self) -> tuple[list[dict], bool]:
+        self._calls += 1
+        return self._payloads[self._calls % len(self._payloads)], True
+
+    async def _fetch_lock(self, lock_id: int) -> tuple[dict, bool]:
+        lock = next(data for data in self._payloads[0] if data["id"] == lock_id)
+        return lock, True
+
+    async def _execute_lock_operation(self, lock_id: int, action: str) -> None:
+        return None
+
+
+@benchmark("http_request")
+async def bench_http_request(run: Runner) -> None:
+    """Round trip of http_request to a local stub server."""
+    body = json.dumps(local_payload(10)).encode()
+
+    async def handler(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/lock", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        async with ClientSession() as session:
+            await run(
+                "http_request[GET 10 locks]",
+                lambda: http_request(
+                    f"http://127.0.0.1:{port}/lock",
+                    HTTPMethod.GET,
+                    None,
+                    session,
+                    rate_limiter=_UNLIMITED,
+                ),
+            )
+    finally:
+        await runner.cleanup()
+
+
+@benchmark("sync")
+async def bench_sync(run: Runner) -> None:
+    """TedeeClientBase.sync with every lock changing and with none changing."""
+    for size in SYNC_SIZES:
+        local = local_payload(size)
+        changed = [
+            {**data, "batteryLevel": (data["batteryLevel"] + 1) % 101}
+            for data in local
+        ]
+        for label, payloads in (("changed", [local, changed]), ("unchanged", [local])):
+            client = _StubClient(payloads)
+            await client.get_locks()
+            await run(f"sync[{size} locks, {label}]", client.sync)
+
+
+@benchmark("webhook")
+async def bench_webhook(run: Runner) -> None:
+    """parse_webhook_message for every event type, then with state changes.
+
+    The client keeps an index, a state table and a listener up to date, so
+    the changing events time the whole propagation of a change.
+    """
+    client = _StubClient([local_payload(100)])
+    await client.get_locks()
+    client.state_table = LockStateTable()
+    client.subscribe(None, lambda lock, change: None)
+    for event, data in WEBHOOK_EVENTS.items():
+        message = {"event": event, "data": {**data, "deviceId": 1}}
+        await run(
+            f"parse_webhook_message[{event}]",
+            lambda message=message: client.parse_webhook_message(message),
+        )
+    for name, events in WEBHOOK_CHANGES.items():
+        messages = cycle(
+            [
+                {"event": event, "data": {**data, "deviceId": 1}}
+                for event, data in events
+            ]
+        )
+        await run(
+            f"parse_webhook_message[changed {name}]",
+            lambda messages=messages: client.parse_webhook_message(next(messages)),
+        )
+
+    # The raw path against decoding with the standard library first.
+    body = json.dumps(
+        {
+            "event": "lock-status-changed",
+            "data": {**WEBHOOK_EVENTS["lock-status-changed"], "deviceId": 1},
+        }
+    ).encode()
+    await run(
+        "json.loads+parse_webhook_message[lock-status-changed]",
+        lambda: client.parse_webhook_message(json.loads(body)),
+    )
+    await run(
+        "parse_webhook_raw[lock-status-changed]",
+        lambda: client.parse_webhook_raw(body),
+    )
+
+
+@benchmark("models")
+async def bench_models(run: Runner) -> None:
+    """Building, updating and serializing locks."""
+    local = local_payload(MODEL_LOCKS)
+    cloud = cloud_payload(MODEL_LOCKS)
+    for shape, payload in (("local", local), ("cloud", cloud)):
+        data = payload[0]
+        await run(
+            f"from_api_response[{shape}]",
+            lambda data=data: TedeeLock.from_api_response(data),
+        )
+        await run(
+            f"from_api_responses[{shape}, 10k locks]",
+            lambda payload=payload, local=shape == "local": (
+                TedeeLock.from_api_responses(payload, local=local)
+            ),
+        )
+
+    locks = TedeeLock.from_api_responses(local, local=True)
+    locks_by_id = {lock.id: lock for lock in locks}
+    dicts = [lock.to_dict() for lock in locks]
+
+    def update() -> None:
+        for data in cloud:
+            locks_by_id[data["id"]].update_from_api_response(
+                data, include_settings=True
+            )
+
+    await run("update_from_api_response[cloud, 10k locks]", update)
+    await run(
+        "update_many[cloud, 10k locks]",
+        lambda: TedeeLock.update_many(locks_by_id, cloud, include_settings=True),
+    )
+    await run("to_dict[10k locks]", lambda: [lock.to_dict() for lock in locks])
+    await run(
+        "from_dict[10k locks]",
+        lambda: [TedeeLock.from_dict(data) for data in dicts],
+    )
+
+
+@benchmark("memory")
+async def bench_memory(run: Runner) -> None:
+    """Creating 100k slotted locks, reporting their memory use.
+
+    The memory of an equivalent dataclass with a ``__dict__`` per instance is
+    printed for comparison; only the creation time is stored.
+    """
+    dict_lock = make_dataclass(
+        "DictLock",
+        [
+            (f.name, f.type)
+            if f.default is MISSING
+            else (f.name, f.type, field(default=f.default))
+            for f in fields(TedeeLock)
+        ],
+    )
+    for cls in (TedeeLock, dict_lock):
+        tracemalloc.start()
+        locks = _create_locks(cls)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del locks
+        name = f"memory[{cls.__name__}]"
+        print(f"{name:<56}{size / MEMORY_LOCKS:>9.0f} B/lock")
+    await run("TedeeLock[100k locks]", lambda: _create_locks(TedeeLock))
+
+
+@benchmark("import")
+async def bench_import(run: Runner) -> None:
+    """Import time of the package, each run in a fresh interpreter."""
+    for name, statement in IMPORT_STATEMENTS.items():
+        await run(
+            f"import[{name}]",
+            lambda statement=statement: _run_python(statement),
+        )
+
+
+@benchmark("auth")
+async def bench_auth(run: Runner) -> None:
+    """Building the local API authentication header."""
+    async with TedeeLocalClient(local_token="token", local_ip="127.0.0.1") as client:
+        await run("_local_api_header", lambda: client._local_api_header)
+
+
+def _create_locks(cls: type) -> list[Any]:
+    return [
+        cls(name="Front Door", id=i, battery_level=i % 101)
+        for i in range(MEMORY_LOCKS)
+    ]
+
+
+async def _run_python(statement: str) -> None:
+    """Run *statement* in a new interpreter."""
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", statement)
+    if await process.wait():
+        raise RuntimeError(f"{statement!r} failed")
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import pytest
-from aiohttp import ClientSession
 from aioresponses import aioresponses
 
-from aiotedee import TedeeLock, TedeeLockState
+from aiotedee import RateLimiter, TedeeLock, TedeeLockState
 from aiotedee.client import TedeeCloudClient, TedeeLocalClient
 
 
@@ -89,24 +88,20 @@ def sample_lock():
 
 @pytest.fixture
 async def local_client():
-    """Return a TedeeLocalClient with a real aiohttp session."""
-    session = ClientSession()
-    client = TedeeLocalClient(
+    """Return a TedeeLocalClient owning a real aiohttp session."""
+    async with TedeeLocalClient(
         local_token="tok",
         local_ip="192.168.1.1",
-        session=session,
-    )
-    yield client
-    await session.close()
+        rate_limiter=RateLimiter(),
+    ) as client:
+        yield client
 
 
 @pytest.fixture
 async def cloud_client():
-    """Return a TedeeCloudClient with a real aiohttp session."""
-    session = ClientSession()
-    client = TedeeCloudClient(
+    """Return a TedeeCloudClient owning a real aiohttp session."""
+    async with TedeeCloudClient(
         personal_token="cloud-key",
-        session=session,
-    )
-    yield client
-    await session.close()
+        rate_limiter=RateLimiter(),
+    ) as client:
+        yield client
@@ -0,0 +1,31 @@
+"""Tests for local API token generation."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from email.utils import formatdate
+
+from aiotedee.auth import LocalTokenProvider
+
+
+def test_token_matches_bridge_format():
+    token = LocalTokenProvider("secret").token()
+    digest, ms = token[:64], token[64:]
+    assert digest == hashlib.sha256(f"secret{ms}".encode()).hexdigest()
+    assert abs(int(ms) - time.time() * 1000) < 5000
+
+
+def test_observe_date_corrects_clock_offset():
+    provider = LocalTokenProvider("secret")
+    assert provider.observe_date(formatdate(time.time() + 30, usegmt=True))
+    assert 29 <= provider.clock_offset <= 31
+    assert abs(int(provider.token()[64:]) - (time.time() + 30) * 1000) < 2000
+
+
+def test_observe_date_ignores_noise_and_garbage():
+    provider = LocalTokenProvider("secret")
+    assert not provider.observe_date(formatdate(time.time(), usegmt=True))
+    assert not provider.observe_date("not a date")
+    assert not provider.observe_date(None)
+    assert provider.clock_offset == 0
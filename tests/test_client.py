@@ -2,24 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from email.utils import formatdate
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp import ClientSession
+from yarl import URL
 
 from aiotedee import (
     TedeeClientException,
+    TedeeDoorState,
     TedeeLock,
+    TedeeLockChange,
     TedeeLockState,
     TedeeWebhookException,
 )
 from aiotedee.client import TedeeCloudClient, TedeeLocalClient
-from aiotedee.const import API_URL_BRIDGE, API_URL_LOCK, API_URL_SYNC
-from aiotedee.exceptions import TedeeDataUpdateException
+from aiotedee.const import (
+    API_URL_BRIDGE,
+    API_URL_LOCK,
+    API_URL_SYNC,
+    LOCAL_CONNECTION_LIMIT,
+)
+from aiotedee.exceptions import TedeeDataUpdateException, TedeeLocalAuthException
 
 from .conftest import BRIDGE_JSON, LOCAL_API_BASE, LOCK_CLOUD_JSON, LOCK_LOCAL_JSON
 
 
+_real_sleep = asyncio.sleep
+
+
 @pytest.fixture(autouse=True)
 def _no_sleep():
     """Prevent real asyncio.sleep delays in lock operations."""
@@ -54,11 +68,165 @@ def test_webhook_dispatches_lock_status_changed(local_client):
     local_client._locks[1] = TedeeLock(
         name="L", id=1, type=2, state=TedeeLockState.LOCKED
     )
-    local_client.parse_webhook_message({
+    change = local_client.parse_webhook_message({
         "event": "lock-status-changed",
         "data": {"deviceId": 1, "state": 2, "jammed": 0, "doorState": 3},
     })
     assert local_client._locks[1].state == TedeeLockState.UNLOCKED
+    assert change == TedeeLockChange(
+        1,
+        {
+            "state": (TedeeLockState.LOCKED, TedeeLockState.UNLOCKED),
+            "door_state": (TedeeDoorState.NOT_PAIRED, TedeeDoorState.CLOSED),
+        },
+    )
+
+
+def test_subscribe_dispatches_only_on_change(local_client):
+    local_client._locks[1] = TedeeLock(name="L", id=1, type=2)
+    local_client._locks[2] = TedeeLock(name="L2", id=2, type=2)
+    lock_1, lock_2, every = [], [], []
+    local_client.subscribe(1, lambda lock, change: lock_1.append(change))
+    local_client.subscribe(2, lambda lock, change: lock_2.append(change))
+    unsubscribe = local_client.subscribe(
+        None, lambda lock, change: every.append(change)
+    )
+
+    message = {
+        "event": "device-battery-level-changed",
+        "data": {"deviceId": 1, "batteryLevel": 50},
+    }
+    local_client.parse_webhook_message(message)
+    local_client.parse_webhook_message(message)  # no change, no dispatch
+    assert [c.changes for c in lock_1] == [{"battery_level": (None, 50)}]
+    assert lock_2 == []
+    assert every == lock_1
+
+    unsubscribe()
+    unsubscribe()
+    local_client.parse_webhook_message(
+        {"event": "device-battery-start-charging", "data": {"deviceId": 1}}
+    )
+    assert len(lock_1) == 2
+    assert len(every) == 1
+    assert None not in local_client._listeners
+
+
+def test_subscriber_error_does_not_stop_dispatch(local_client):
+    local_client._locks[1] = TedeeLock(name="L", id=1, type=2)
+    received = []
+    local_client.subscribe(1, lambda lock, change: 1 / 0)
+    local_client.subscribe(1, lambda lock, change: received.append(lock.id))
+    local_client.parse_webhook_message(
+        {"event": "device-battery-start-charging", "data": {"deviceId": 1}}
+    )
+    assert received == [1]
+
+
+def test_webhook_batch_coalesces_per_lock(local_client):
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.LOCKED, battery_level=80
+    )
+    local_client._locks[2] = TedeeLock(name="L2", id=2, type=2)
+    dispatched = []
+    local_client.subscribe(None, lambda lock, change: dispatched.append(change))
+
+    def battery(lock_id, level):
+        return {
+            "event": "device-battery-level-changed",
+            "data": {"deviceId": lock_id, "batteryLevel": level},
+        }
+
+    def status(state):
+        return {
+            "event": "lock-status-changed",
+            "data": {"deviceId": 1, "state": state, "jammed": 0, "doorState": 0},
+        }
+
+    changes = local_client.parse_webhook_messages([
+        battery(1, 50),
+        status(2),
+        {"event": "lock-status-changed"},  # no data, skipped
+        battery(1, 60),
+        battery(2, 10),
+        status(6),  # back to the initial state
+        battery(1, 70),
+    ])
+    assert changes == [
+        TedeeLockChange(1, {"battery_level": (80, 70)}),
+        TedeeLockChange(2, {"battery_level": (None, 10)}),
+    ]
+    assert dispatched == changes
+    assert local_client._locks[1].state == TedeeLockState.LOCKED
+
+
+def test_webhook_batch_skips_malformed_messages(local_client):
+    local_client._locks[1] = TedeeLock(name="L", id=1, type=2)
+    local_client._locks[2] = TedeeLock(name="L2", id=2, type=2)
+    changes = local_client.parse_webhook_messages([
+        {
+            "event": "lock-status-changed",
+            "data": {"deviceId": 2, "state": [2], "doorState": {}},
+        },
+        ["not", "a", "message"],
+        "lock-status-changed",
+        {"event": "device-battery-level-changed", "data": [1]},
+        {"event": ["unhashable"], "data": {"deviceId": 1}},
+        {"event": "device-battery-level-changed", "data": {"deviceId": [1]}},
+        {
+            "event": "device-battery-level-changed",
+            "data": {"deviceId": 1, "batteryLevel": 50},
+        },
+    ])
+    assert changes == [
+        TedeeLockChange(
+            2, {"state": (TedeeLockState.UNCALIBRATED, TedeeLockState.UNKNOWN)}
+        ),
+        TedeeLockChange(1, {"battery_level": (None, 50)}),
+    ]
+
+
+async def test_webhook_batch_reports_intermediate_states(mock_api, local_client):
+    local_client._operation_poll_interval = None
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.UNLOCKED
+    )
+    mock_api.post(f"{LOCAL_API_BASE}/lock/1/pull", payload=None)
+    task = asyncio.create_task(local_client.pull(1))
+    await asyncio.wait({task}, timeout=0.05)
+    assert not task.done()
+    local_client.parse_webhook_messages([
+        {
+            "event": "lock-status-changed",
+            "data": {"deviceId": 1, "state": state, "jammed": 0, "doorState": 3},
+        }
+        for state in (
+            TedeeLockState.PULLING,
+            TedeeLockState.PULLED,
+            TedeeLockState.UNLOCKED,
+        )
+    ])
+    await asyncio.wait_for(task, 1)
+
+
+def test_webhook_raw_body(local_client):
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.LOCKED
+    )
+    change = local_client.parse_webhook_raw(
+        b'{"event": "lock-status-changed",'
+        b' "data": {"deviceId": 1, "state": 2, "jammed": 0, "doorState": 3}}'
+    )
+    assert change.changes["state"] == (
+        TedeeLockState.LOCKED,
+        TedeeLockState.UNLOCKED,
+    )
+
+
+@pytest.mark.parametrize("body", [b"not json", b"[1, 2]"], ids=["invalid", "list"])
+def test_webhook_raw_invalid_body_raises(local_client, body):
+    with pytest.raises(TedeeWebhookException):
+        local_client.parse_webhook_raw(body)
 
 
 def test_webhook_missing_data_raises(local_client):
@@ -83,6 +251,45 @@ def test_webhook_silently_ignored_messages(local_client, event, data):
     assert local_client._locks[1].state == TedeeLockState.LOCKED
 
 
+async def test_snapshot_round_trip(tmp_path, mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    await local_client.get_locks()
+    path = tmp_path / "locks.json"
+    await local_client.save_snapshot(path)
+    assert [p.name for p in tmp_path.iterdir()] == ["locks.json"]
+
+    async with TedeeLocalClient(local_token="tok", local_ip="192.168.1.1") as client:
+        assert await client.load_snapshot(path) == 1
+        assert client.locks_dict == local_client.locks_dict
+        assert client.lock_age(12345) is None
+        assert [lock.id for lock in client.locks_by_state(TedeeLockState.LOCKED)] == [
+            12345
+        ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"not json", b'{"version": 99, "locks": []}', b'{"version": 1, "locks": [{}]}'],
+    ids=["invalid-json", "unknown-version", "invalid-lock"],
+)
+async def test_snapshot_invalid_raises(tmp_path, local_client, content):
+    path = tmp_path / "locks.json"
+    path.write_bytes(content)
+    with pytest.raises(TedeeClientException, match="Invalid snapshot"):
+        await local_client.load_snapshot(path)
+    assert local_client.locks_dict == {}
+
+
+async def test_snapshot_missing_file(tmp_path, local_client):
+    assert await local_client.load_snapshot(tmp_path / "missing.json") == 0
+    assert local_client.locks_dict == {}
+
+
+async def test_snapshot_unreadable_raises(tmp_path, local_client):
+    with pytest.raises(TedeeClientException, match="Unable to read snapshot"):
+        await local_client.load_snapshot(tmp_path)
+
+
 # =============================================================================
 # TedeeLocalClient
 # =============================================================================
@@ -113,6 +320,29 @@ async def test_local_sync_updates_existing_lock(mock_api, local_client):
     assert local_client._locks[12345].state == TedeeLockState.UNLOCKED
 
 
+async def test_local_sync_returns_changes(mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    await local_client.get_locks()
+    mock_api.get(
+        f"{LOCAL_API_BASE}/lock",
+        payload=[{**LOCK_LOCAL_JSON, "state": 2, "isConnected": False}],
+    )
+    assert await local_client.sync() == [
+        TedeeLockChange(
+            12345,
+            {
+                "state": (TedeeLockState.LOCKED, TedeeLockState.UNLOCKED),
+                "is_connected": (True, False),
+            },
+        )
+    ]
+    mock_api.get(
+        f"{LOCAL_API_BASE}/lock",
+        payload=[{**LOCK_LOCAL_JSON, "state": 2, "isConnected": False}],
+    )
+    assert await local_client.sync() == []
+
+
 async def test_local_sync_includes_settings(mock_api, local_client):
     """Local sync passes include_settings=True, updating deviceSettings."""
     local_client._locks[12345] = TedeeLock(
@@ -141,22 +371,108 @@ async def test_local_sync_skips_unknown_lock_ids(mock_api, local_client):
     assert 9999 not in local_client._locks
 
 
+async def test_sync_max_age_skips_fresh_locks(mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    await local_client.get_locks()
+    await local_client.sync(max_age=60)
+    assert sum(len(calls) for calls in mock_api.requests.values()) == 1
+    assert local_client.lock_age(12345) < 60
+
+
+async def test_sync_max_age_refreshes_stale_locks(mock_api, local_client):
+    local_client._locks[12345] = TedeeLock(name="Front Door", id=12345, type=2)
+    assert local_client.lock_age(12345) is None
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    await local_client.sync(max_age=60)
+    assert local_client._locks[12345].state == TedeeLockState.LOCKED
+    assert local_client.lock_age(12345) < 60
+
+
+def test_webhook_confirms_lock_state(local_client):
+    local_client._locks[1] = TedeeLock(name="L", id=1, type=2)
+    local_client._last_confirmed[1] = time.monotonic() - 120
+    local_client.parse_webhook_message({
+        "event": "device-battery-level-changed",
+        "data": {"deviceId": 1, "batteryLevel": 50},
+    })
+    assert local_client.lock_age(1) < 60
+
+
+async def test_concurrent_syncs_share_one_request(mock_api, local_client):
+    local_client._locks[12345] = TedeeLock(
+        name="Front Door", id=12345, type=2, state=TedeeLockState.LOCKED
+    )
+    mock_api.get(
+        f"{LOCAL_API_BASE}/lock", payload=[{**LOCK_LOCAL_JSON, "state": 2}]
+    )
+    await asyncio.gather(*(local_client.sync() for _ in range(5)))
+    assert sum(len(calls) for calls in mock_api.requests.values()) == 1
+    assert local_client._locks[12345].state == TedeeLockState.UNLOCKED
+    assert local_client._inflight == {}
+
+
+async def test_concurrent_get_locks_share_failure(mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[])
+    results = await asyncio.gather(
+        local_client.get_locks(), local_client.get_locks(), return_exceptions=True
+    )
+    assert all(isinstance(r, TedeeClientException) for r in results)
+    assert sum(len(calls) for calls in mock_api.requests.values()) == 1
+
+
 @pytest.mark.parametrize(
-    ("method", "expected_path"),
+    ("method", "expected_path", "initial_state", "polled_states"),
     [
-        ("lock", "/lock/1/lock"),
-        ("unlock", "/lock/1/unlock?mode=3"),
-        ("open", "/lock/1/unlock?mode=4"),
-        ("pull", "/lock/1/pull"),
+        ("lock", "/lock/1/lock", 2, [5, 6]),
+        ("unlock", "/lock/1/unlock?mode=3", 6, [2]),
+        ("open", "/lock/1/unlock?mode=4", 6, [4, 7, 2]),
+        ("pull", "/lock/1/pull", 2, [2, 8, 2]),
     ],
     ids=["lock", "unlock", "open", "pull"],
 )
-async def test_local_lock_operations(mock_api, local_client, method, expected_path):
+async def test_local_lock_operations(
+    mock_api, local_client, method, expected_path, initial_state, polled_states
+):
+    """Operations return once a targeted poll shows the target state."""
+    local_client._operation_poll_interval = 0
     local_client._locks[1] = TedeeLock(
-        name="L", id=1, type=2, duration_pullspring=4
+        name="L", id=1, type=2, state=initial_state, duration_pullspring=4
     )
     mock_api.post(f"{LOCAL_API_BASE}{expected_path}", payload=None)
+    for state in polled_states:
+        mock_api.get(
+            f"{LOCAL_API_BASE}/lock/1",
+            payload={**LOCK_LOCAL_JSON, "id": 1, "state": state},
+        )
     await getattr(local_client, method)(1)
+    assert local_client._locks[1].state == polled_states[-1]
+
+
+async def test_lock_operation_completes_on_webhook(mock_api, local_client):
+    local_client._operation_poll_interval = None
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.LOCKED
+    )
+    mock_api.post(f"{LOCAL_API_BASE}/lock/1/unlock?mode=3", payload=None)
+    task = asyncio.create_task(local_client.unlock(1))
+    await asyncio.wait({task}, timeout=0.05)
+    assert not task.done()
+    local_client.parse_webhook_message({
+        "event": "lock-status-changed",
+        "data": {"deviceId": 1, "state": 2, "jammed": 0, "doorState": 3},
+    })
+    await asyncio.wait_for(task, 1)
+
+
+async def test_lock_operation_delay_is_upper_bound(mock_api, local_client):
+    local_client._operation_poll_interval = None
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.UNLOCKED
+    )
+    mock_api.post(f"{LOCAL_API_BASE}/lock/1/lock", payload=None)
+    with patch("aiotedee.client.base.LOCK_DELAY", 0.01):
+        await asyncio.wait_for(local_client.lock(1), 1)
+    assert local_client._state_waiters == {}
 
 
 async def test_local_lock_operation_failure_raises(mock_api, local_client):
@@ -168,6 +484,28 @@ async def test_local_lock_operation_failure_raises(mock_api, local_client):
         await local_client.lock(1)
 
 
+async def test_local_rejected_token_retried_once_with_bridge_clock(
+    mock_api, local_client
+):
+    bridge_date = formatdate(time.time() + 60, usegmt=True)
+    mock_api.get(
+        f"{LOCAL_API_BASE}/bridge", status=401, headers={"Date": bridge_date}
+    )
+    mock_api.get(f"{LOCAL_API_BASE}/bridge", payload=BRIDGE_JSON)
+    bridge = await local_client.get_local_bridge()
+    assert bridge.id == 99
+    assert 59 <= local_client._token_provider.clock_offset <= 61
+
+
+async def test_local_rejected_token_fails_fast(mock_api, local_client):
+    for _ in range(2):
+        mock_api.get(f"{LOCAL_API_BASE}/bridge", status=401)
+    with pytest.raises(TedeeLocalAuthException):
+        await local_client.get_local_bridge()
+    assert sum(len(calls) for calls in mock_api.requests.values()) == 2
+    asyncio.sleep.assert_not_awaited()
+
+
 async def test_local_get_bridge(mock_api, local_client):
     mock_api.get(f"{LOCAL_API_BASE}/bridge", payload=BRIDGE_JSON)
     bridge = await local_client.get_local_bridge()
@@ -209,6 +547,59 @@ async def test_local_api_header_no_token_returns_empty():
     await session.close()
 
 
+async def test_local_ping_tracks_latency_and_degradation(mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/bridge", status=500)
+    with pytest.raises(TedeeDataUpdateException):
+        await local_client.ping()
+    assert local_client.is_degraded
+    assert local_client.latency is None
+
+    mock_api.get(f"{LOCAL_API_BASE}/bridge", payload=BRIDGE_JSON)
+    latency = await local_client.ping()
+    assert not local_client.is_degraded
+    assert local_client.latency == latency >= 0
+
+
+async def test_local_heartbeat_probes_until_stopped(mock_api, local_client):
+    mock_api.get(f"{LOCAL_API_BASE}/bridge", payload=BRIDGE_JSON, repeat=True)
+    with patch("asyncio.sleep", _real_sleep):
+        local_client.start_heartbeat(interval=0.01)
+        await _real_sleep(0.05)
+        await local_client.stop_heartbeat()
+    assert len(mock_api.requests[("GET", URL(f"{LOCAL_API_BASE}/bridge"))]) > 1
+    assert local_client.latency is not None
+    assert local_client._heartbeat is None
+
+
+@pytest.mark.parametrize(
+    ("local_ip", "use_dns_cache"),
+    [("192.168.1.1", False), ("bridge.local", True)],
+    ids=["ip-literal", "hostname"],
+)
+async def test_local_owned_session_lifecycle(mock_api, local_ip, use_dns_cache):
+    mock_api.get(
+        f"http://{local_ip}:80/v1.0/lock", payload=[LOCK_LOCAL_JSON]
+    )
+    async with TedeeLocalClient(local_token="tok", local_ip=local_ip) as client:
+        await client.get_locks()
+        session = client.session
+        assert session.connector.limit_per_host == LOCAL_CONNECTION_LIMIT
+        assert session.connector.use_dns_cache is use_dns_cache
+    assert session.closed
+    with pytest.raises(TedeeClientException, match="closed"):
+        await client.get_locks()
+    assert client._session is None
+
+
+async def test_local_close_keeps_passed_session():
+    async with ClientSession() as session:
+        async with TedeeLocalClient(
+            local_token="tok", local_ip="192.168.1.1", session=session
+        ) as client:
+            assert client.session is session
+        assert not session.closed
+
+
 # =============================================================================
 # TedeeCloudClient
 # =============================================================================
@@ -274,6 +665,12 @@ async def test_cloud_get_bridges(mock_api, cloud_client):
 
 
 async def test_cloud_lock_sends_correct_url(mock_api, cloud_client):
+    cloud_client._operation_poll_interval = 0
     cloud_client._locks[1] = TedeeLock(name="L", id=1, type=2)
     mock_api.post(f"{API_URL_LOCK}1/operation/lock", payload=None)
+    mock_api.get(
+        f"{API_URL_LOCK}1/sync",
+        payload={"result": {"id": 1, "lockProperties": {"state": 6}}},
+    )
     await cloud_client.lock(1)
+    assert cloud_client._locks[1].state == TedeeLockState.LOCKED
@@ -0,0 +1,42 @@
+"""Tests for JSON codec selection."""
+
+from __future__ import annotations
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from aiotedee.codec import (
+    _detect_dumps,
+    _detect_loads,
+    _stdlib_dumps,
+    json_dumps,
+    json_loads,
+)
+
+
+def test_falls_back_to_stdlib():
+    with patch.dict(sys.modules, {"orjson": None, "msgspec": None}):
+        assert _detect_loads() is json.loads
+        assert _detect_dumps() is _stdlib_dumps
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"a": [1, 2]}', '{"a": [1, 2]}'], ids=["bytes", "str"]
+)
+def test_default_loads(body):
+    assert json_loads(body) == {"a": [1, 2]}
+
+
+def test_default_loads_raises_value_error():
+    with pytest.raises(ValueError):
+        json_loads(b"{")
+
+
+def test_default_dumps_roundtrip():
+    assert json_loads(json_dumps({"url": "x", "headers": []})) == {
+        "url": "x",
+        "headers": [],
+    }
@@ -0,0 +1,122 @@
+"""Tests for the fleet manager."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp import ClientSession
+
+from aiotedee import TedeeFleet, TedeeLock, TedeeLockState
+from aiotedee.client import TedeeLocalClient
+from aiotedee.exceptions import TedeeDataUpdateException
+
+from .conftest import LOCK_LOCAL_JSON
+
+BRIDGE_IPS = {1: "192.168.1.1", 2: "192.168.1.2"}
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    """Prevent real asyncio.sleep delays in local API retries."""
+    with patch("aiotedee.client.local.asyncio.sleep", new_callable=AsyncMock):
+        yield
+
+
+@pytest.fixture
+async def fleet():
+    """Return a fleet with one local client per bridge in BRIDGE_IPS."""
+    session = ClientSession()
+    fleet = TedeeFleet(timeout=1)
+    for bridge, ip in BRIDGE_IPS.items():
+        fleet.add_client(
+            bridge,
+            TedeeLocalClient(local_token="tok", local_ip=ip, session=session),
+        )
+    yield fleet
+    await session.close()
+
+
+async def test_fleet_get_locks_merges_locks(mock_api, fleet):
+    for bridge, ip in BRIDGE_IPS.items():
+        mock_api.get(
+            f"http://{ip}:80/v1.0/lock",
+            payload=[{**LOCK_LOCAL_JSON, "connectedToId": bridge}],
+        )
+    errors = await fleet.get_locks()
+    assert errors == {}
+    assert set(fleet.locks) == {(1, 12345), (2, 12345)}
+
+
+async def test_fleet_reports_failures_per_bridge(mock_api, fleet):
+    mock_api.get("http://192.168.1.1:80/v1.0/lock", payload=[LOCK_LOCAL_JSON])
+    for _ in range(3):
+        mock_api.get("http://192.168.1.2:80/v1.0/lock", status=500)
+    errors = await fleet.get_locks()
+    assert list(errors) == [2]
+    assert isinstance(errors[2], TedeeDataUpdateException)
+    assert fleet.errors == errors
+    assert set(fleet.locks) == {(1, 12345)}
+
+
+async def test_fleet_slow_bridge_does_not_block(mock_api, fleet):
+    fleet.clients[1]._locks[12345] = TedeeLock(
+        name="Front Door", id=12345, type=2, state=TedeeLockState.LOCKED
+    )
+    mock_api.get(
+        "http://192.168.1.1:80/v1.0/lock",
+        payload=[{**LOCK_LOCAL_JSON, "state": 2}],
+    )
+    fleet._timeout = 0.05
+    with patch.object(fleet.clients[2], "sync", side_effect=asyncio.Event().wait):
+        errors = await fleet.sync()
+    assert list(errors) == [2]
+    assert isinstance(errors[2], TimeoutError)
+    assert fleet.locks[(1, 12345)].state == TedeeLockState.UNLOCKED
+
+
+def test_fleet_remove_client(fleet):
+    client = fleet.remove_client(2)
+    assert isinstance(client, TedeeLocalClient)
+    assert list(fleet.clients) == [1]
+
+
+async def test_fleet_state_table(mock_api, fleet):
+    mock_api.get(
+        "http://192.168.1.1:80/v1.0/lock",
+        payload=[{**LOCK_LOCAL_JSON, "connectedToId": 1, "isConnected": False}],
+    )
+    mock_api.get(
+        "http://192.168.1.2:80/v1.0/lock",
+        payload=[{**LOCK_LOCAL_JSON, "id": 54321, "connectedToId": 2}],
+    )
+    await fleet.get_locks()
+    assert len(fleet.state_table) == 2
+    assert fleet.state_table.disconnected_per_bridge() == {1: [(1, 12345)]}
+
+    fleet.remove_client(1)
+    assert (1, 12345) not in fleet.state_table
+    assert len(fleet.state_table) == 1
+
+
+async def test_fleet_state_table_duplicate_lock_ids(mock_api, fleet):
+    mock_api.get(
+        "http://192.168.1.1:80/v1.0/lock",
+        payload=[{**LOCK_LOCAL_JSON, "connectedToId": 1, "isConnected": False}],
+    )
+    mock_api.get(
+        "http://192.168.1.2:80/v1.0/lock",
+        payload=[{**LOCK_LOCAL_JSON, "connectedToId": 2, "state": 2}],
+    )
+    await fleet.get_locks()
+    table = fleet.state_table
+    assert len(table) == 2
+    assert table.with_state(TedeeLockState.LOCKED) == [(1, 12345)]
+    assert table.with_state(TedeeLockState.UNLOCKED) == [(2, 12345)]
+    assert table.disconnected() == [(1, 12345)]
+
+    fleet.remove_client(1)
+    assert len(table) == 1
+    assert (2, 12345) in table
+    assert table.with_state(TedeeLockState.UNLOCKED) == [(2, 12345)]
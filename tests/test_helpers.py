@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock
+
 import pytest
 from aiohttp import ClientError, ClientSession
 
@@ -11,7 +13,7 @@ from aiotedee.exceptions import (
     TedeeClientException,
     TedeeRateLimitException,
 )
-from aiotedee.helpers import http_request, is_personal_key_valid
+from aiotedee.helpers import http_request, is_personal_key_valid, parse_retry_after
 
 
 @pytest.fixture
@@ -81,3 +83,55 @@ async def test_is_personal_key_valid_by_status(mock_api, session, status, expect
 async def test_is_personal_key_valid_connection_error(mock_api, session):
     mock_api.get(API_URL_DEVICE, exception=ClientError("connection error"))
     assert await is_personal_key_valid("key", session) is False
+
+
+async def test_http_request_acquires_rate_limit_per_host(mock_api, session):
+    mock_api.get("http://test/api", payload={})
+    limiter = AsyncMock()
+    await http_request("http://test/api", "GET", {}, session, rate_limiter=limiter)
+    limiter.acquire.assert_awaited_once_with("test")
+
+
+async def test_http_request_rate_limit_retry_after(mock_api, session):
+    mock_api.get("http://test/api", status=429, headers={"Retry-After": "12"})
+    with pytest.raises(TedeeRateLimitException) as exc_info:
+        await http_request("http://test/api", "GET", {}, session)
+    assert exc_info.value.retry_after == 12
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("3", 3.0),
+        ("-1", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None),
+    ],
+    ids=["missing", "seconds", "negative", "past-date", "invalid"],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+async def test_http_request_uses_custom_codec(mock_api, session):
+    mock_api.post("http://test/api", body=b'{"id": 1}')
+    result = await http_request(
+        "http://test/api",
+        "POST",
+        {},
+        session,
+        json_data={"url": "x"},
+        json_loads=lambda body: ("decoded", body),
+        json_dumps=lambda obj: b"encoded",
+    )
+    assert result == ("decoded", b'{"id": 1}')
+    (call,) = next(iter(mock_api.requests.values()))
+    assert call.kwargs["data"] == b"encoded"
+    assert call.kwargs["headers"]["Content-Type"] == "application/json"
+
+
+async def test_http_request_invalid_json_raises(mock_api, session):
+    mock_api.get("http://test/api", body=b"<html>")
+    with pytest.raises(TedeeClientException, match="Invalid JSON"):
+        await http_request("http://test/api", "GET", {}, session)
@@ -0,0 +1,73 @@
+"""Tests for the secondary lock indexes."""
+
+from __future__ import annotations
+
+from aiotedee.index import LockIndex
+from aiotedee.models import TedeeDoorState, TedeeLock, TedeeLockState
+
+from .conftest import LOCAL_API_BASE, LOCK_LOCAL_JSON
+
+
+def test_index_add_and_remove():
+    index = LockIndex()
+    index.add(TedeeLock(name="A", id=1, state=TedeeLockState.LOCKED))
+    index.add(TedeeLock(name="B", id=2, state=TedeeLockState.LOCKED))
+    assert index.get("state", TedeeLockState.LOCKED) == {1, 2}
+
+    index.add(TedeeLock(name="A", id=1, state=TedeeLockState.UNLOCKED))
+    assert index.get("state", TedeeLockState.LOCKED) == {2}
+    assert index.get("state", TedeeLockState.UNLOCKED) == {1}
+
+    index.remove(2)
+    index.remove(99)
+    assert 2 not in index
+    assert len(index) == 1
+    assert index.get("state", TedeeLockState.LOCKED) == frozenset()
+
+
+def test_index_update_moves_changed_fields_only():
+    index = LockIndex()
+    lock = TedeeLock(name="A", id=1, state=TedeeLockState.LOCKED)
+    index.add(lock)
+    changes = lock.update_fields(
+        {"state": TedeeLockState.UNLOCKED, "battery_level": 10}
+    )
+    index.update(lock, changes)
+    assert index.get("state", TedeeLockState.LOCKED) == frozenset()
+    assert index.get("state", TedeeLockState.UNLOCKED) == {1}
+    assert index.get("door_state", TedeeDoorState.NOT_PAIRED) == {1}
+
+
+async def test_client_lookups_follow_updates(mock_api, local_client):
+    mock_api.get(
+        f"{LOCAL_API_BASE}/lock",
+        payload=[
+            {**LOCK_LOCAL_JSON, "connectedToId": 7},
+            {**LOCK_LOCAL_JSON, "id": 2, "connectedToId": 8},
+        ],
+    )
+    await local_client.get_locks()
+    assert {lock.id for lock in local_client.locks_by_bridge(7)} == {12345}
+    assert {
+        lock.id for lock in local_client.locks_by_state(TedeeLockState.LOCKED)
+    } == {12345, 2}
+
+    local_client.parse_webhook_message(
+        {
+            "event": "lock-status-changed",
+            "data": {"deviceId": 2, "state": 2, "jammed": 0, "doorState": 2},
+        }
+    )
+    assert [
+        lock.id for lock in local_client.locks_by_state(TedeeLockState.LOCKED)
+    ] == [12345]
+    assert [
+        lock.id for lock in local_client.locks_by_door_state(TedeeDoorState.OPENED)
+    ] == [2]
+    local_client.parse_webhook_message(
+        {
+            "event": "device-connection-changed",
+            "data": {"deviceId": 2, "isConnected": 0},
+        }
+    )
+    assert [lock.id for lock in local_client.locks_by_connection(False)] == [2]
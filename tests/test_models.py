@@ -77,6 +77,8 @@ def test_from_api_response(payload):
     # Not jammed (stateChangeResult=0 / jammed=0)
     assert lock.is_jammed is False
 
+    assert lock.connected_to_id == 99
+
 
 @pytest.mark.parametrize(
     ("payload", "jammed_key"),
@@ -144,6 +146,20 @@ def test_update_changes_state_fields(sample_lock):
     assert sample_lock.duration_pullspring == 7
 
 
+def test_update_returns_changed_fields(sample_lock):
+    changes = sample_lock.update_from_api_response(
+        {**LOCK_LOCAL_JSON, "state": 2, "batteryLevel": 70}, include_settings=True
+    )
+    assert changes == {
+        "state": (TedeeLockState.LOCKED, TedeeLockState.UNLOCKED),
+        "battery_level": (80, 70),
+        "door_state": (TedeeDoorState.NOT_PAIRED, TedeeDoorState.CLOSED),
+        "connected_to_id": (None, 99),
+    }
+    unchanged = {**LOCK_LOCAL_JSON, "state": 2, "batteryLevel": 70}
+    assert sample_lock.update_from_api_response(unchanged) == {}
+
+
 def test_update_with_include_settings(sample_lock):
     """Local sync includes deviceSettings."""
     sample_lock.update_from_api_response(
@@ -162,6 +178,54 @@ def test_update_with_include_settings(sample_lock):
     assert sample_lock.duration_pullspring == 3
 
 
+# -- Batch construction and updates -------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [LOCK_CLOUD_JSON, LOCK_LOCAL_JSON],
+    ids=["cloud", "local"],
+)
+def test_from_api_responses_matches_single(payload):
+    payloads = [payload, {**payload, "id": 2, "name": "Back Door"}]
+    assert TedeeLock.from_api_responses(iter(payloads)) == [
+        TedeeLock.from_api_response(data) for data in payloads
+    ]
+    assert TedeeLock.from_api_responses([]) == []
+    if payload is LOCK_LOCAL_JSON:
+        assert TedeeLock.from_api_responses(payloads, local=True) == [
+            TedeeLock.from_api_response(data) for data in payloads
+        ]
+
+
+def test_from_api_responses_detects_shape_per_lock():
+    local = {**LOCK_LOCAL_JSON, "id": 2, "state": 2}
+    cloud_without_properties = {
+        key: value for key, value in LOCK_CLOUD_JSON.items() if key != "lockProperties"
+    }
+    payloads = [cloud_without_properties, LOCK_CLOUD_JSON, local]
+    assert TedeeLock.from_api_responses(payloads) == [
+        TedeeLock.from_api_response(data) for data in payloads
+    ]
+    assert TedeeLock.from_api_responses(payloads)[1].state == TedeeLockState.LOCKED
+
+
+def test_update_many_skips_unknown_locks():
+    lock = TedeeLock.from_api_response(LOCK_CLOUD_JSON)
+    unlocked = {
+        **LOCK_CLOUD_JSON,
+        "lockProperties": {**LOCK_CLOUD_JSON["lockProperties"], "state": 2},
+    }
+    updated = TedeeLock.update_many(
+        {lock.id: lock},
+        [unlocked, {**unlocked, "id": 999}],
+    )
+    assert updated == [
+        (lock, {"state": (TedeeLockState.LOCKED, TedeeLockState.UNLOCKED)})
+    ]
+    assert TedeeLock.update_many({lock.id: lock}, [unlocked]) == [(lock, {})]
+
+
 # -- TedeeLock computed properties ---------------------------------------------
 
 
@@ -191,6 +255,33 @@ def test_is_jammed(state_change_result, expected):
     assert lock.is_jammed is expected
 
 
+@pytest.mark.parametrize(
+    "model",
+    [TedeeLock(name="L", id=1), TedeeBridge(id=1, serial="SN", name="B")],
+    ids=["lock", "bridge"],
+)
+def test_models_are_slotted(model):
+    assert not hasattr(model, "__dict__")
+    assert type(model).from_dict(model.to_dict()) == model
+
+
+def test_lock_dict_round_trip(sample_lock):
+    data = sample_lock.to_dict()
+    assert data["state"] == 6 and type(data["state"]) is int
+    assert TedeeLock.from_dict(data) == sample_lock
+    assert TedeeLock.from_dict({"name": "L", "id": 1}) == TedeeLock(name="L", id=1)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{"name": "L"}, {"name": "L", "id": 1, "state": 42}],
+    ids=["missing-field", "unknown-enum-value"],
+)
+def test_lock_from_dict_invalid_raises(data):
+    with pytest.raises(KeyError):
+        TedeeLock.from_dict(data)
+
+
 # -- TedeeBridge.from_api_response ---------------------------------------------
 
 
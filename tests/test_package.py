@@ -0,0 +1,41 @@
+"""Tests for the package namespace."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import aiotedee
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Return the modules loaded after running *code* in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["import aiotedee", "from aiotedee.webhook import WEBHOOK_HANDLERS"],
+    ids=["package", "webhook"],
+)
+def test_import_does_not_load_aiohttp(code):
+    assert "aiohttp" not in _imported_modules(code)
+
+
+def test_lazy_attributes_resolve():
+    for name in aiotedee.__all__:
+        assert getattr(aiotedee, name).__name__ == name
+    assert set(aiotedee.__all__) <= set(dir(aiotedee))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        aiotedee.no_such_name  # noqa: B018
@@ -0,0 +1,48 @@
+"""Tests for the per-host rate limiter."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiotedee.ratelimit import RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def mock_sleep():
+    """Patch asyncio.sleep in the rate limiter."""
+    with patch("aiotedee.ratelimit.asyncio.sleep", new_callable=AsyncMock) as m:
+        yield m
+
+
+def test_token_bucket_queues_reservations():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+async def test_no_delay_within_budget(mock_sleep):
+    limiter = RateLimiter(rate=10, burst=5)
+    for _ in range(5):
+        await limiter.acquire("bridge")
+    mock_sleep.assert_not_awaited()
+
+
+async def test_delay_when_budget_exhausted(mock_sleep):
+    limiter = RateLimiter(rate=10, burst=1)
+    await limiter.acquire("bridge")
+    await limiter.acquire("bridge")
+    mock_sleep.assert_awaited_once()
+    assert mock_sleep.await_args.args[0] == pytest.approx(0.1, abs=0.01)
+
+
+async def test_hosts_have_separate_budgets(mock_sleep):
+    limiter = RateLimiter(rate=10, burst=1, host_limits={"cloud": (10, 3)})
+    await limiter.acquire("bridge-1")
+    await limiter.acquire("bridge-2")
+    for _ in range(3):
+        await limiter.acquire("cloud")
+    mock_sleep.assert_not_awaited()
@@ -0,0 +1,108 @@
+"""Tests for retry policies."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from aiotedee import RetryPolicy, TedeeLock
+from aiotedee.exceptions import (
+    TedeeAuthException,
+    TedeeClientException,
+    TedeeConflictException,
+    TedeeDataUpdateException,
+    TedeeNotFoundException,
+    TedeeTimeoutException,
+)
+
+from .conftest import LOCAL_API_BASE, LOCK_LOCAL_JSON
+
+
+@pytest.fixture
+def mock_sleep():
+    """Patch asyncio.sleep in the local client."""
+    with patch("aiotedee.client.local.asyncio.sleep", new_callable=AsyncMock) as m:
+        yield m
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (TedeeAuthException(), False),
+        (TedeeNotFoundException(), False),
+        (TedeeConflictException(), True),
+        (TedeeTimeoutException(), True),
+        (TedeeClientException(), True),
+        (ValueError(), False),
+    ],
+    ids=["auth", "404", "409", "timeout", "generic", "unrelated"],
+)
+def test_default_decisions(exc, expected):
+    assert RetryPolicy().should_retry(exc) is expected
+
+
+def test_decision_override_by_class():
+    policy = RetryPolicy(retry_on={TedeeConflictException: False})
+    assert policy.should_retry(TedeeConflictException()) is False
+    # Classes not overridden keep their default decision.
+    assert policy.should_retry(TedeeTimeoutException()) is True
+    assert policy.should_retry(TedeeNotFoundException()) is False
+
+
+def test_decision_override_of_base_class():
+    policy = RetryPolicy(retry_on={TedeeClientException: False})
+    assert policy.should_retry(TedeeClientException()) is False
+    assert policy.should_retry(TedeeTimeoutException()) is True
+
+
+def test_exponential_backoff_without_jitter():
+    policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=3, jitter=False)
+    ex = TedeeTimeoutException()
+    delays = [policy.next_delay(ex, attempt, 0) for attempt in range(1, 6)]
+    assert delays == [1, 2, 3, 3, None]
+
+
+def test_jitter_stays_within_bounds():
+    policy = RetryPolicy(base_delay=1)
+    for _ in range(50):
+        assert 0 <= policy.next_delay(TedeeTimeoutException(), 2, 0) <= 2
+
+
+def test_max_elapsed_gives_up():
+    policy = RetryPolicy(base_delay=1, jitter=False, max_elapsed=1.5)
+    assert policy.next_delay(TedeeTimeoutException(), 1, 0) == 1
+    assert policy.next_delay(TedeeTimeoutException(), 1, 1) is None
+
+
+async def test_local_client_skips_retry_on_404(mock_api, local_client, mock_sleep):
+    mock_api.get(f"{LOCAL_API_BASE}/bridge", status=404)
+    with pytest.raises(TedeeDataUpdateException):
+        await local_client._local_api_call("/bridge", "GET")
+    mock_sleep.assert_not_awaited()
+
+
+async def test_local_client_per_call_policy(mock_api, local_client, mock_sleep):
+    policy = RetryPolicy(max_attempts=2, base_delay=0.25, jitter=False)
+    mock_api.get(f"{LOCAL_API_BASE}/lock", status=500)
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    with local_client.use_retry_policy(policy):
+        await local_client.get_locks()
+    assert 12345 in local_client.locks_dict
+    mock_sleep.assert_awaited_once_with(0.25)
+
+
+async def test_local_client_scoped_policy_ends_with_block(
+    mock_api, local_client, mock_sleep
+):
+    local_client.locks_dict[1] = TedeeLock(name="L", id=1)
+    mock_api.post(f"{LOCAL_API_BASE}/lock/1/lock", status=500)
+    with local_client.use_retry_policy(RetryPolicy(max_attempts=1)):
+        with pytest.raises(TedeeDataUpdateException):
+            await local_client.lock(1)
+    mock_sleep.assert_not_awaited()
+
+    mock_api.get(f"{LOCAL_API_BASE}/lock", status=500)
+    mock_api.get(f"{LOCAL_API_BASE}/lock", payload=[LOCK_LOCAL_JSON])
+    await local_client.get_locks()
+    mock_sleep.assert_awaited_once()
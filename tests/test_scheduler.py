@@ -0,0 +1,73 @@
+"""Tests for the cloud request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from aiotedee.const import API_URL_LOCK
+from aiotedee.exceptions import TedeeRateLimitException
+from aiotedee.scheduler import RequestPriority, RequestScheduler
+
+
+async def test_lock_operations_run_before_polls():
+    scheduler = RequestScheduler(max_concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        order.append(name)
+        if name == "first":
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(
+            scheduler.run(RequestPriority.POLL, lambda: request("first"))
+        )
+    ]
+    await asyncio.sleep(0)
+    for name, priority in (
+        ("bridges", RequestPriority.BACKGROUND),
+        ("sync", RequestPriority.POLL),
+        ("unlock", RequestPriority.LOCK_OPERATION),
+    ):
+        tasks.append(
+            asyncio.create_task(scheduler.run(priority, lambda n=name: request(n)))
+        )
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["first", "unlock", "sync", "bridges"]
+
+
+async def test_rate_limit_retries_after_retry_after():
+    scheduler = RequestScheduler()
+    request = AsyncMock(
+        side_effect=[TedeeRateLimitException("429", retry_after=0.01), "ok"]
+    )
+    assert await scheduler.run(RequestPriority.LOCK_OPERATION, request) == "ok"
+    assert request.await_count == 2
+
+
+async def test_rate_limit_gives_up_after_max_retries():
+    scheduler = RequestScheduler(max_retries=2)
+    request = AsyncMock(side_effect=TedeeRateLimitException("429", retry_after=0))
+    with pytest.raises(TedeeRateLimitException):
+        await scheduler.run(RequestPriority.POLL, request)
+    assert request.await_count == 2
+
+
+def test_scheduler_shared_per_key():
+    scheduler = RequestScheduler.for_key("key-a")
+    assert RequestScheduler.for_key("key-a") is scheduler
+    assert RequestScheduler.for_key("key-b") is not scheduler
+
+
+async def test_cloud_client_retries_rate_limited_operation(mock_api, cloud_client):
+    mock_api.post(
+        f"{API_URL_LOCK}1/operation/lock", status=429, headers={"Retry-After": "0"}
+    )
+    mock_api.post(f"{API_URL_LOCK}1/operation/lock", payload=None)
+    await cloud_client._execute_lock_operation(1, "lock")
@@ -0,0 +1,126 @@
+"""Tests for the webhook receiver server."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from aiotedee import (
+    TedeeLock,
+    TedeeLockState,
+    TedeeWebhookException,
+    TedeeWebhookServer,
+)
+from aiotedee.client import TedeeLocalClient
+
+STATUS_MESSAGE = {
+    "event": "lock-status-changed",
+    "data": {"deviceId": 1, "state": 2, "jammed": 0, "doorState": 3},
+}
+
+
+@pytest.fixture
+def server(local_client):
+    """Return a webhook server routing bridge 99 to the local client."""
+    local_client._locks[1] = TedeeLock(
+        name="L", id=1, type=2, state=TedeeLockState.LOCKED
+    )
+    return TedeeWebhookServer({99: local_client}, max_queue_size=1)
+
+
+@pytest.fixture
+async def http(server):
+    """Return a test HTTP client for the server's application."""
+    async with TestClient(TestServer(server.app)) as client:
+        yield client
+
+
+async def test_callback_routed_to_client(server, http, local_client):
+    response = await http.post("/tedee/99", json=STATUS_MESSAGE)
+    assert response.status == 204
+    await server.join()
+    assert local_client.locks_dict[1].state == TedeeLockState.UNLOCKED
+
+
+@pytest.mark.parametrize(
+    ("path", "body", "status"),
+    [
+        ("/tedee/42", "{}", 404),
+        ("/tedee/99", "not json", 400),
+        ("/tedee/99", "[1, 2]", 400),
+    ],
+    ids=["unknown-bridge", "invalid-json", "not-an-object"],
+)
+async def test_rejected_callbacks(http, path, body, status):
+    response = await http.post(path, data=body)
+    assert response.status == status
+
+
+async def test_full_queue_applies_backpressure(server, http):
+    server._workers[0].cancel()
+    assert (await http.post("/tedee/99", json=STATUS_MESSAGE)).status == 204
+    assert (await http.post("/tedee/99", json=STATUS_MESSAGE)).status == 503
+
+
+async def test_secret_required_when_configured(local_client):
+    server = TedeeWebhookServer({99: local_client}, secret="s3cret")
+    async with TestClient(TestServer(server.app)) as http:
+        response = await http.post("/tedee/99", json=STATUS_MESSAGE)
+        assert response.status == 401
+        response = await http.post(
+            "/tedee/99", json=STATUS_MESSAGE, headers={"X-Tedee-Secret": "wrong"}
+        )
+        assert response.status == 401
+        response = await http.post(
+            "/tedee/99", json=STATUS_MESSAGE, headers={"X-Tedee-Secret": "s3cret"}
+        )
+        assert response.status == 204
+
+
+async def test_register_webhook_sends_secret(local_client):
+    server = TedeeWebhookServer(
+        {99: local_client}, host="0.0.0.0", secret="s3cret"
+    )
+    with patch.object(
+        local_client, "register_webhook", AsyncMock(return_value=1)
+    ) as register:
+        await server.register_webhook(99, "10.0.0.2", [{"X-Other": "1"}])
+    register.assert_awaited_once_with(
+        "http://10.0.0.2:8080/tedee/99",
+        [{"X-Other": "1"}, {"X-Tedee-Secret": "s3cret"}],
+    )
+
+
+async def test_register_webhook_rejects_unreachable_loopback(local_client):
+    server = TedeeWebhookServer({99: local_client})
+    with patch.object(local_client, "register_webhook", AsyncMock()) as register:
+        with pytest.raises(TedeeWebhookException, match="127.0.0.1"):
+            await server.register_webhook(99, "10.0.0.2")
+        register.assert_not_awaited()
+
+        await server.register_webhook(99, "127.0.0.1")
+        register.assert_awaited_once()
+
+
+async def test_callback_decoded_with_client_decoder():
+    decoded = []
+
+    def json_loads(body):
+        decoded.append(body)
+        return json.loads(body)
+
+    client = TedeeLocalClient(
+        local_token="tok", local_ip="192.168.1.1", json_loads=json_loads
+    )
+    server = TedeeWebhookServer({99: client})
+    async with client, TestClient(TestServer(server.app)) as http:
+        response = await http.post("/tedee/99", json=STATUS_MESSAGE)
+        assert response.status == 204
+    assert len(decoded) == 1
+
+
+def test_url_for(server):
+    assert server.url_for(99, "10.0.0.2") == "http://10.0.0.2:8080/tedee/99"
@@ -0,0 +1,106 @@
+"""Tests running the local client against the bridge simulator."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from aiotedee import RateLimiter, RetryPolicy, TedeeLockState, TedeeWebhookServer
+from aiotedee.client import TedeeLocalClient
+from aiotedee.exceptions import TedeeDataUpdateException, TedeeLocalAuthException
+from aiotedee.simulator import TedeeBridgeSimulator
+
+
+async def _client(simulator: TedeeBridgeSimulator, **kwargs) -> TedeeLocalClient:
+    return TedeeLocalClient(
+        local_token=kwargs.pop("local_token", "secret"),
+        local_ip="127.0.0.1",
+        local_port=simulator.port,
+        rate_limiter=RateLimiter(rate=1000, burst=1000),
+        **kwargs,
+    )
+
+
+async def _wait_for(predicate, timeout: float = 2) -> None:
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+async def test_get_locks_and_operate():
+    async with TedeeBridgeSimulator(
+        token="secret", num_locks=3, operation_time=0.05
+    ) as simulator:
+        async with await _client(
+            simulator, operation_poll_interval=0.01
+        ) as client:
+            await client.get_locks()
+            assert sorted(client.locks_dict) == [1, 2, 3]
+            assert client.locks_by_bridge(1)
+            assert (await client.get_local_bridge()).id == 1
+
+            await asyncio.wait_for(client.unlock(2), 2)
+            assert client.locks_dict[2].state == TedeeLockState.UNLOCKED
+            assert simulator.locks[2].state == TedeeLockState.UNLOCKED
+
+
+@pytest.mark.parametrize("method", ["open", "pull"])
+async def test_pull_operations_complete(method):
+    async with TedeeBridgeSimulator(
+        token="secret", operation_time=0.05
+    ) as simulator:
+        async with await _client(
+            simulator, operation_poll_interval=0.01
+        ) as client:
+            await client.get_locks()
+            lock = client.locks_dict[1]
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await getattr(client, method)(1)
+            assert loop.time() - start < (lock.duration_pullspring + 1) / 4
+            assert lock.state == TedeeLockState.UNLOCKED
+
+
+async def test_token_validation():
+    async with TedeeBridgeSimulator(token="secret") as simulator:
+        async with await _client(simulator, local_token="wrong") as client:
+            with pytest.raises(TedeeLocalAuthException):
+                await client.get_locks()
+        assert simulator.requests["GET /v1.0/lock"] == 2
+
+
+async def test_client_follows_bridge_clock():
+    async with TedeeBridgeSimulator(token="secret", clock_offset=300) as simulator:
+        async with await _client(simulator) as client:
+            await client.get_locks()
+            assert simulator.requests["GET /v1.0/lock"] == 2
+            assert 299 <= client._token_provider.clock_offset <= 301
+
+
+async def test_error_rate():
+    async with TedeeBridgeSimulator(token="secret", error_rate=1) as simulator:
+        async with await _client(
+            simulator, retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        ) as client:
+            with pytest.raises(TedeeDataUpdateException):
+                await client.get_locks()
+        assert simulator.requests["GET /v1.0/lock"] == 2
+
+
+async def test_state_changes_fire_webhooks():
+    async with TedeeBridgeSimulator(token="secret", num_locks=2) as simulator:
+        async with await _client(simulator) as client:
+            await client.get_locks()
+            server = TedeeWebhookServer({1: client})
+            async with TestServer(server.app) as receiver:
+                webhook_id = await client.register_webhook(
+                    str(receiver.make_url("/tedee/1"))
+                )
+                simulator.update_lock(2, battery_level=42, is_charging=True)
+                await _wait_for(lambda: client.locks_dict[2].is_charging)
+                assert client.locks_dict[2].battery_level == 42
+
+                await client.delete_webhook(webhook_id)
+                assert simulator.callbacks == []
@@ -0,0 +1,99 @@
+"""Tests for the columnar lock state table."""
+
+from __future__ import annotations
+
+import pytest
+
+from aiotedee import LockStateTable, TedeeLock
+from aiotedee.models import TedeeDoorState, TedeeLockState
+
+
+@pytest.fixture
+def table() -> LockStateTable:
+    """Return a table holding a small mixed fleet."""
+    return LockStateTable(
+        [
+            TedeeLock(
+                name="A",
+                id=1,
+                state=TedeeLockState.LOCKED,
+                battery_level=80,
+                door_state=TedeeDoorState.CLOSED,
+                is_connected=True,
+                connected_to_id=10,
+            ),
+            TedeeLock(
+                name="B",
+                id=2,
+                state=TedeeLockState.UNLOCKED,
+                battery_level=15,
+                is_connected=False,
+                connected_to_id=10,
+            ),
+            TedeeLock(
+                name="C",
+                id=3,
+                state=TedeeLockState.LOCKED,
+                battery_level=None,
+                state_change_result=1,
+                is_connected=False,
+                connected_to_id=20,
+            ),
+            TedeeLock(name="D", id=4, battery_level=5, is_connected=True),
+        ]
+    )
+
+
+def test_queries(table):
+    assert len(table) == 4
+    assert table.with_state(TedeeLockState.LOCKED) == [1, 3]
+    assert table.with_door_state(TedeeDoorState.CLOSED) == [1]
+    assert table.jammed() == [3]
+    assert table.battery_below(20) == [2, 4]
+    assert table.disconnected() == [2, 3]
+    assert table.disconnected_per_bridge() == {10: [2], 20: [3]}
+
+
+def test_upsert_updates_row(table):
+    table.upsert(
+        TedeeLock(name="B", id=2, state=TedeeLockState.LOCKED, is_connected=True)
+    )
+    assert len(table) == 4
+    assert table.with_state(TedeeLockState.LOCKED) == [1, 2, 3]
+    assert table.disconnected() == [3]
+
+
+def test_remove_moves_last_row(table):
+    table.remove(1)
+    table.remove(99)
+    assert 1 not in table
+    assert len(table) == 3
+    assert table.battery_below(20) == [4, 2]
+    assert table.with_state(TedeeLockState.LOCKED) == [3]
+
+
+def test_keyed_rows_do_not_collide():
+    table = LockStateTable()
+    table.upsert(TedeeLock(name="A", id=1, state=TedeeLockState.LOCKED), "a")
+    table.upsert(TedeeLock(name="B", id=1, state=TedeeLockState.UNLOCKED), "b")
+    assert len(table) == 2
+    assert table.with_state(TedeeLockState.LOCKED) == [("a", 1)]
+
+    table.remove(1, "a")
+    assert ("a", 1) not in table
+    assert table.with_state(TedeeLockState.UNLOCKED) == [("b", 1)]
+
+
+async def test_client_keeps_table_in_sync(local_client):
+    local_client._locks[1] = TedeeLock(name="A", id=1, state=TedeeLockState.LOCKED)
+    local_client.state_table = LockStateTable()
+    assert local_client.state_table.with_state(TedeeLockState.LOCKED) == [1]
+
+    local_client.parse_webhook_message(
+        {
+            "event": "lock-status-changed",
+            "data": {"deviceId": 1, "state": 2, "jammed": 0},
+        }
+    )
+    assert local_client.state_table.with_state(TedeeLockState.LOCKED) == []
+    assert local_client.state_table.with_state(TedeeLockState.UNLOCKED) == [1]